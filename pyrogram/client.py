@@ -60,6 +60,31 @@ from .session.internals import MsgId
 
 log = logging.getLogger(__name__)
 
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # Don't override an event loop policy explicitly chosen by the user or swap it under a loop that is already
+        # running
+        if type(asyncio.get_event_loop_policy()) is asyncio.DefaultEventLoopPolicy:
+            try:
+                current_loop = asyncio.get_event_loop()
+            except RuntimeError:
+                current_loop = None
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+            # Keep the event loop of this thread, which may have been set by the user and which clients bind to, so
+            # that only the event loops created from now on (e.g.: by asyncio.run) are uvloop ones
+            if current_loop is not None:
+                asyncio.set_event_loop(current_loop)
+
+            log.info("Using uvloop")
+
 
 class Client(Methods):
     """Pyrogram Client, the main means for interacting with Telegram.
@@ -137,6 +162,14 @@ class Client(Methods):
             Number of maximum concurrent workers for handling incoming updates.
             Defaults to ``min(32, os.cpu_count() + 4)``.
 
+        shard_updates (``bool``, *optional*):
+            Pass True to always handle the updates of a chat with the same worker, in the order they were received.
+            A slow handler then only delays the chats sharing its worker, and each worker handles bursts of already
+            received updates in batches. However, a handler must not wait for a later update of its own chat (e.g.:
+            when waiting for the user's reply in a conversation), as that update is queued behind it and the handler
+            would wait forever.
+            Defaults to False (updates are handled by whichever worker is free).
+
         workdir (``str``, *optional*):
             Define a custom working directory.
             The working directory is the location in the filesystem where Pyrogram will store the session files.
@@ -208,6 +241,7 @@ class Client(Methods):
         phone_code: str = None,
         password: str = None,
         workers: int = WORKERS,
+        shard_updates: bool = False,
         workdir: str = WORKDIR,
         plugins: dict = None,
         parse_mode: "enums.ParseMode" = enums.ParseMode.DEFAULT,
@@ -235,6 +269,7 @@ class Client(Methods):
         self.phone_code = phone_code
         self.password = password
         self.workers = workers
+        self.shard_updates = shard_updates
         self.workdir = Path(workdir)
         self.plugins = plugins
         self.parse_mode = parse_mode
@@ -532,7 +567,7 @@ class Client(Methods):
                                 users.update({u.id: u for u in diff.users})
                                 chats.update({c.id: c for c in diff.chats})
 
-                self.dispatcher.updates_queue.put_nowait((update, users, chats))
+                self.dispatcher.put_update(update, users, chats)
         elif isinstance(updates, (raw.types.UpdateShortMessage, raw.types.UpdateShortChatMessage)):
             diff = await self.invoke(
                 raw.functions.updates.GetDifference(
@@ -543,7 +578,7 @@ class Client(Methods):
             )
 
             if diff.new_messages:
-                self.dispatcher.updates_queue.put_nowait((
+                self.dispatcher.put_update(
                     raw.types.UpdateNewMessage(
                         message=diff.new_messages[0],
                         pts=updates.pts,
@@ -551,12 +586,12 @@ class Client(Methods):
                     ),
                     {u.id: u for u in diff.users},
                     {c.id: c for c in diff.chats}
-                ))
+                )
             else:
                 if diff.other_updates:  # The other_updates list can be empty
-                    self.dispatcher.updates_queue.put_nowait((diff.other_updates[0], {}, {}))
+                    self.dispatcher.put_update(diff.other_updates[0], {}, {})
         elif isinstance(updates, raw.types.UpdateShort):
-            self.dispatcher.updates_queue.put_nowait((updates.update, {}, {}))
+            self.dispatcher.put_update(updates.update, {}, {})
         elif isinstance(updates, raw.types.UpdatesTooLong):
             log.info(updates)
 
@@ -17,18 +17,19 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
+import bisect
 import inspect
 import logging
-from collections import OrderedDict
 
 import pyrogram
-from pyrogram import utils
+from pyrogram import raw, utils
 from pyrogram.handlers import (
     CallbackQueryHandler, MessageHandler, EditedMessageHandler, DeletedMessagesHandler,
     UserStatusHandler, RawUpdateHandler, InlineQueryHandler, PollHandler,
     ChosenInlineResultHandler, ChatMemberUpdatedHandler, ChatJoinRequestHandler,
     ErrorHandler
 )
+from pyrogram.handlers.handler import Handler
 from pyrogram.raw.types import (
     UpdateNewMessage, UpdateNewChannelMessage, UpdateNewScheduledMessage,
     UpdateEditMessage, UpdateEditChannelMessage,
@@ -42,119 +43,110 @@ from pyrogram.raw.types import (
 log = logging.getLogger(__name__)
 
 
-class Dispatcher:
-    NEW_MESSAGE_UPDATES = (UpdateNewMessage, UpdateNewChannelMessage, UpdateNewScheduledMessage)
-    EDIT_MESSAGE_UPDATES = (UpdateEditMessage, UpdateEditChannelMessage)
-    DELETE_MESSAGES_UPDATES = (UpdateDeleteMessages, UpdateDeleteChannelMessages)
-    CALLBACK_QUERY_UPDATES = (UpdateBotCallbackQuery, UpdateInlineBotCallbackQuery)
-    CHAT_MEMBER_UPDATES = (UpdateChatParticipant, UpdateChannelParticipant)
-    USER_STATUS_UPDATES = (UpdateUserStatus,)
-    BOT_INLINE_QUERY_UPDATES = (UpdateBotInlineQuery,)
-    POLL_UPDATES = (UpdateMessagePoll,)
-    CHOSEN_INLINE_RESULT_UPDATES = (UpdateBotInlineSend,)
-    CHAT_JOIN_REQUEST_UPDATES = (UpdateBotChatInviteRequester,)
+async def _message_parser(client, update, users, chats):
+    return await pyrogram.types.Message._parse(client, update.message, users, chats)
 
-    def __init__(self, client: "pyrogram.Client"):
-        self.client = client
-        self.loop = asyncio.get_event_loop()
 
-        self.handler_worker_tasks = []
-        self.locks_list = []
+async def _scheduled_message_parser(client, update, users, chats):
+    return await pyrogram.types.Message._parse(client, update.message, users, chats, is_scheduled=True)
 
-        self.updates_queue = asyncio.Queue()
-        self.groups = OrderedDict()
 
-        self.error_handlers = []
-        self.error_handler_coros = []
-        self.global_error_handler = None
-        self.global_error_handler_coro = None
+async def _deleted_messages_parser(client, update, users, chats):
+    return utils.parse_deleted_messages(client, update)
 
-        async def message_parser(update, users, chats):
-            return (
-                await pyrogram.types.Message._parse(self.client, update.message, users, chats,
-                                                    isinstance(update, UpdateNewScheduledMessage)),
-                MessageHandler
-            )
 
-        async def edited_message_parser(update, users, chats):
-            # Edited messages are parsed the same way as new messages, but the handler is different
-            parsed, _ = await message_parser(update, users, chats)
+async def _callback_query_parser(client, update, users, chats):
+    return await pyrogram.types.CallbackQuery._parse(client, update, users)
 
-            return (
-                parsed,
-                EditedMessageHandler
-            )
 
-        async def deleted_messages_parser(update, users, chats):
-            return (
-                utils.parse_deleted_messages(self.client, update),
-                DeletedMessagesHandler
-            )
+async def _user_status_parser(client, update, users, chats):
+    return pyrogram.types.User._parse_user_status(client, update)
 
-        async def callback_query_parser(update, users, chats):
-            return (
-                await pyrogram.types.CallbackQuery._parse(self.client, update, users),
-                CallbackQueryHandler
-            )
 
-        async def user_status_parser(update, users, chats):
-            return (
-                pyrogram.types.User._parse_user_status(self.client, update),
-                UserStatusHandler
-            )
+async def _inline_query_parser(client, update, users, chats):
+    return pyrogram.types.InlineQuery._parse(client, update, users)
 
-        async def inline_query_parser(update, users, chats):
-            return (
-                pyrogram.types.InlineQuery._parse(self.client, update, users),
-                InlineQueryHandler
-            )
 
-        async def poll_parser(update, users, chats):
-            return (
-                pyrogram.types.Poll._parse_update(self.client, update),
-                PollHandler
-            )
+async def _poll_parser(client, update, users, chats):
+    return pyrogram.types.Poll._parse_update(client, update)
 
-        async def chosen_inline_result_parser(update, users, chats):
-            return (
-                pyrogram.types.ChosenInlineResult._parse(self.client, update, users),
-                ChosenInlineResultHandler
-            )
 
-        async def chat_member_updated_parser(update, users, chats):
-            return (
-                pyrogram.types.ChatMemberUpdated._parse(self.client, update, users, chats),
-                ChatMemberUpdatedHandler
-            )
+async def _chosen_inline_result_parser(client, update, users, chats):
+    return pyrogram.types.ChosenInlineResult._parse(client, update, users)
 
-        async def chat_join_request_parser(update, users, chats):
-            return (
-                pyrogram.types.ChatJoinRequest._parse(self.client, update, users, chats),
-                ChatJoinRequestHandler
-            )
 
-        self.update_parsers = {
-            Dispatcher.NEW_MESSAGE_UPDATES: message_parser,
-            Dispatcher.EDIT_MESSAGE_UPDATES: edited_message_parser,
-            Dispatcher.DELETE_MESSAGES_UPDATES: deleted_messages_parser,
-            Dispatcher.CALLBACK_QUERY_UPDATES: callback_query_parser,
-            Dispatcher.USER_STATUS_UPDATES: user_status_parser,
-            Dispatcher.BOT_INLINE_QUERY_UPDATES: inline_query_parser,
-            Dispatcher.POLL_UPDATES: poll_parser,
-            Dispatcher.CHOSEN_INLINE_RESULT_UPDATES: chosen_inline_result_parser,
-            Dispatcher.CHAT_MEMBER_UPDATES: chat_member_updated_parser,
-            Dispatcher.CHAT_JOIN_REQUEST_UPDATES: chat_join_request_parser
-        }
-
-        self.update_parsers = {key: value for key_tuple, value in self.update_parsers.items() for key in key_tuple}
+async def _chat_member_updated_parser(client, update, users, chats):
+    return pyrogram.types.ChatMemberUpdated._parse(client, update, users, chats)
+
+
+async def _chat_join_request_parser(client, update, users, chats):
+    return pyrogram.types.ChatJoinRequest._parse(client, update, users, chats)
+
+
+class Dispatcher:
+    NEW_MESSAGE_UPDATES = (UpdateNewMessage, UpdateNewChannelMessage)
+    SCHEDULED_MESSAGE_UPDATES = (UpdateNewScheduledMessage,)
+    EDIT_MESSAGE_UPDATES = (UpdateEditMessage, UpdateEditChannelMessage)
+    DELETE_MESSAGES_UPDATES = (UpdateDeleteMessages, UpdateDeleteChannelMessages)
+    CALLBACK_QUERY_UPDATES = (UpdateBotCallbackQuery, UpdateInlineBotCallbackQuery)
+    CHAT_MEMBER_UPDATES = (UpdateChatParticipant, UpdateChannelParticipant)
+    USER_STATUS_UPDATES = (UpdateUserStatus,)
+    BOT_INLINE_QUERY_UPDATES = (UpdateBotInlineQuery,)
+    POLL_UPDATES = (UpdateMessagePoll,)
+    CHOSEN_INLINE_RESULT_UPDATES = (UpdateBotInlineSend,)
+    CHAT_JOIN_REQUEST_UPDATES = (UpdateBotChatInviteRequester,)
+
+    # The parser of each kind of update and the handler class the parsed update is dispatched to. Knowing the handler
+    # class upfront allows dropping updates no handler is interested in before parsing them.
+    UPDATE_PARSERS = {
+        update_type: (parser, handler_type)
+        for update_types, (parser, handler_type) in {
+            NEW_MESSAGE_UPDATES: (_message_parser, MessageHandler),
+            SCHEDULED_MESSAGE_UPDATES: (_scheduled_message_parser, MessageHandler),
+            # Edited messages are parsed the same way as new messages, but the handler is different
+            EDIT_MESSAGE_UPDATES: (_message_parser, EditedMessageHandler),
+            DELETE_MESSAGES_UPDATES: (_deleted_messages_parser, DeletedMessagesHandler),
+            CALLBACK_QUERY_UPDATES: (_callback_query_parser, CallbackQueryHandler),
+            USER_STATUS_UPDATES: (_user_status_parser, UserStatusHandler),
+            BOT_INLINE_QUERY_UPDATES: (_inline_query_parser, InlineQueryHandler),
+            POLL_UPDATES: (_poll_parser, PollHandler),
+            CHOSEN_INLINE_RESULT_UPDATES: (_chosen_inline_result_parser, ChosenInlineResultHandler),
+            CHAT_MEMBER_UPDATES: (_chat_member_updated_parser, ChatMemberUpdatedHandler),
+            CHAT_JOIN_REQUEST_UPDATES: (_chat_join_request_parser, ChatJoinRequestHandler)
+        }.items()
+        for update_type in update_types
+    }
+
+    BATCH_SIZE = 32
+
+    def __init__(self, client: "pyrogram.Client"):
+        self.client = client
+        self.loop = None
+
+        self.handler_worker_tasks = []
+        self.registry_lock = asyncio.Lock()
+
+        # When sharding is enabled, updates are sharded by chat across one queue per worker, so that updates coming from
+        # the same chat are always handled in order by the same worker, while different chats are handled concurrently.
+        # Otherwise, all workers share a single queue.
+        self.updates_queues = [asyncio.Queue() for _ in range(self.client.workers if self.client.shard_updates else 1)]
+        self.groups = {}
+        self.group_keys = []
+        self.groups_snapshot = ()
+        self.handler_types_snapshot = frozenset()
+
+        # Error handlers by id, in registration order
+        self.error_handlers_map = {}
+        self.error_dispatch = {}
+        self.global_error_handler = None
 
     async def start(self):
+        self.loop = asyncio.get_running_loop()
+
         if not self.client.no_updates:
             for i in range(self.client.workers):
-                self.locks_list.append(asyncio.Lock())
-
                 self.handler_worker_tasks.append(
-                    self.loop.create_task(self.handler_worker(self.locks_list[-1]))
+                    self.loop.create_task(self.handler_worker(self.updates_queues[i % len(self.updates_queues)]))
                 )
 
             log.info(f"Started {self.client.workers} HandlerTasks")
@@ -162,39 +154,63 @@ class Dispatcher:
     async def stop(self):
         if not self.client.no_updates:
             for i in range(self.client.workers):
-                self.updates_queue.put_nowait(None)
+                self.updates_queues[i % len(self.updates_queues)].put_nowait(None)
 
             for i in self.handler_worker_tasks:
                 await i
 
             self.handler_worker_tasks.clear()
-            self.groups.clear()
+
+            async with self.registry_lock:
+                self.groups.clear()
+                self.group_keys.clear()
+                self.update_groups_snapshot()
 
             log.info(f"Stopped {self.client.workers} HandlerTasks")
 
     def add_handler(self, handler, group: int):
         async def fn():
-            for lock in self.locks_list:
-                await lock.acquire()
-
-            try:
+            async with self.registry_lock:
                 if group not in self.groups:
-                    self.groups[group] = []
-                    self.groups = OrderedDict(sorted(self.groups.items()))
+                    self.groups[group] = {}
+                    bisect.insort(self.group_keys, group)
+
+                # Callbacks that don't look like coroutine functions, but might still return a coroutine (e.g.
+                # functools.partial objects or other wrappers), are told apart by their first result instead.
+                handler._is_coro = True if inspect.iscoroutinefunction(handler.callback) else None
 
                 if isinstance(handler, ErrorHandler):
-                    if handler.errors is None:
+                    if handler._is_global:
                         self.global_error_handler = handler
-                        self.global_error_handler_coro = inspect.iscoroutinefunction(handler.callback)
                     else:
-                        self.error_handlers.append(handler)
-                        self.error_handler_coros.append(inspect.iscoroutinefunction(handler.callback))
-                self.groups[group].append(handler)
-            finally:
-                for lock in self.locks_list:
-                    lock.release()
-
-        self.loop.create_task(fn())
+                        self.error_handlers_map[id(handler)] = handler
+
+                        for error_type in handler.errors:
+                            self.error_dispatch.setdefault(error_type, handler)
+
+                # Each group maps a handler class to the handlers an update of that kind has to go through, keyed by
+                # id in registration order, so that they can be removed without scanning. Raw update handlers are part
+                # of every bucket and have their own bucket for updates no other handler in the group is interested in.
+                buckets = self.groups[group]
+
+                if isinstance(handler, RawUpdateHandler):
+                    buckets.setdefault(RawUpdateHandler, {})
+
+                    for bucket in buckets.values():
+                        bucket[id(handler)] = handler
+                else:
+                    for handler_type in type(handler).__mro__:
+                        if handler_type is Handler:
+                            break
+
+                        buckets.setdefault(handler_type, dict(buckets.get(RawUpdateHandler, {})))[id(handler)] = handler
+
+                self.update_groups_snapshot()
+
+        if self.loop is not None:
+            self.loop.create_task(fn())
+        else:
+            asyncio.ensure_future(fn())
         
     def remove_error_handler(self, handler: ErrorHandler = None, error: Exception = None):
         """
@@ -203,131 +219,212 @@ class Dispatcher:
         else Don't use arguments if you want to delete global error handler
         """
         async def fn():
-            for lock in self.locks_list:
-                await lock.acquire()
-
-            try:
+            async with self.registry_lock:
                 if handler:
-                    index = self.error_handlers.index(handler)
-                    self.error_handlers.pop(index)
-                    self.error_handlers_coros.pop(index)
+                    if self.error_handlers_map.pop(id(handler), None) is None:
+                        raise ValueError("Error handler does not exist. Handler was not removed.")
                 elif error:
-                    for index, err in enumerate(self.error_handlers):
-                        if error in err.errors:
-                            self.error_handlers.pop(index)
-                            self.error_handlers_coro.pop(index)
+                    for handler_id, error_handler in list(self.error_handlers_map.items()):
+                        if error in error_handler.errors:
+                            del self.error_handlers_map[handler_id]
                 else:
                     self.global_error_handler = None
-                    self.global_error_handler_coro = None
-            finally:
-                for lock in self.locks_list:
-                    lock.release()
 
-        self.loop.create_task(fn())
+                self.error_dispatch.clear()
+
+                for error_handler in self.error_handlers_map.values():
+                    for error_type in error_handler.errors:
+                        self.error_dispatch.setdefault(error_type, error_handler)
+
+        if self.loop is not None:
+            self.loop.create_task(fn())
+        else:
+            asyncio.ensure_future(fn())
         
 
     def remove_handler(self, handler, group: int):
         async def fn():
-            for lock in self.locks_list:
-                await lock.acquire()
-
-            try:
+            async with self.registry_lock:
                 if group not in self.groups:
                     raise ValueError(f"Group {group} does not exist. Handler was not removed.")
 
-                self.groups[group].remove(handler)
-            finally:
-                for lock in self.locks_list:
-                    lock.release()
+                buckets = [bucket for bucket in self.groups[group].values() if id(handler) in bucket]
+
+                if not buckets:
+                    raise ValueError(f"Handler does not exist in group {group}. Handler was not removed.")
 
-        self.loop.create_task(fn())
+                for bucket in buckets:
+                    del bucket[id(handler)]
+
+                self.update_groups_snapshot()
+
+        if self.loop is not None:
+            self.loop.create_task(fn())
+        else:
+            asyncio.ensure_future(fn())
+
+    def update_groups_snapshot(self):
+        # Handler workers only ever read this immutable copy of the groups, sorted by group id and rebound as a whole
+        # on every change, so that they can iterate it without holding the registry lock.
+        self.groups_snapshot = tuple(
+            {handler_type: tuple(bucket.values()) for handler_type, bucket in self.groups[group].items()}
+            for group in self.group_keys
+        )
+        self.handler_types_snapshot = frozenset(
+            handler_type
+            for group in self.groups_snapshot
+            for handler_type, bucket in group.items()
+            if bucket
+        )
+
+    @staticmethod
+    def get_update_chat_id(update) -> int:
+        peer = getattr(getattr(update, "message", None), "peer_id", None) or getattr(update, "peer", None)
+
+        if isinstance(peer, (raw.types.PeerUser, raw.types.PeerChat, raw.types.PeerChannel)):
+            return utils.get_peer_id(peer)
+
+        if getattr(update, "channel_id", None):
+            return utils.get_channel_id(update.channel_id)
+
+        if getattr(update, "chat_id", None):
+            return -update.chat_id
+
+        return getattr(update, "user_id", None) or 0
+
+    def put_update(self, update, users, chats):
+        if len(self.updates_queues) > 1:
+            queue = self.updates_queues[self.get_update_chat_id(update) % len(self.updates_queues)]
+        else:
+            queue = self.updates_queues[0]
+
+        queue.put_nowait((update, users, chats))
+
+    async def handler_worker(self, queue):
+        batch_size = self.BATCH_SIZE if self.client.shard_updates else 1
 
-    async def handler_worker(self, lock):
         while True:
-            packet = await self.updates_queue.get()
+            packets = [await queue.get()]
+
+            # Drain whatever else is already queued so that a burst of updates is parsed concurrently and then
+            # dispatched back-to-back, in the same order it was received. Workers sharing a single queue don't, so that
+            # updates a running handler might be waiting for stay available to the other workers.
+            while packets[-1] is not None and len(packets) < batch_size:
+                try:
+                    packets.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            stop = packets[-1] is None
+
+            if stop:
+                packets.pop()
+
+            handler_types = self.handler_types_snapshot
+
+            # Unless raw update handlers want everything, skip parsing updates that no handler would receive
+            if RawUpdateHandler not in handler_types:
+                packets = [
+                    packet for packet in packets
+                    if self.UPDATE_PARSERS.get(type(packet[0]), (None, None))[1] in handler_types
+                ]
+
+            results = await asyncio.gather(
+                *(self.parse_update(*packet) for packet in packets),
+                return_exceptions=True
+            )
+
+            for packet, result in zip(packets, results):
+                if isinstance(result, Exception):
+                    log.error(result, exc_info=result)
+                    continue
+
+                try:
+                    await self.handle_update(*packet, *result)
+                except pyrogram.StopPropagation:
+                    pass
+                except Exception as e:
+                    log.error(e, exc_info=e)
 
-            if packet is None:
+            if stop:
                 break
 
-            try:
-                update, users, chats = packet
-                parser = self.update_parsers.get(type(update), None)
+    async def parse_update(self, update, users, chats):
+        parser, handler_type = self.UPDATE_PARSERS.get(type(update), (None, type(None)))
+
+        return (
+            await parser(self.client, update, users, chats) if parser is not None else None,
+            handler_type
+        )
+
+    async def handle_update(self, update, users, chats, parsed_update, handler_type):
+        for group in self.groups_snapshot:
+            for handler in group.get(handler_type) or group.get(RawUpdateHandler, ()):
+                args = None
+
+                if isinstance(handler, handler_type):
+                    try:
+                        if await handler.check(self.client, parsed_update):
+                            args = (parsed_update,)
+                    except Exception as e:
+                        log.error(e, exc_info=e)
+                        continue
+                else:
+                    args = (update, users, chats)
 
-                parsed_update, handler_type = (
-                    await parser(update, users, chats)
-                    if parser is not None
-                    else (None, type(None))
-                )
+                if args is None:
+                    continue
 
-                async with lock:
-                    for group in self.groups.values():
-                        for handler in group:
-                            args = None
-
-                            if isinstance(handler, handler_type):
-                                try:
-                                    if await handler.check(self.client, parsed_update):
-                                        args = (parsed_update,)
-                                except Exception as e:
-                                    log.error(e, exc_info=True)
-                                    continue
-
-                            elif isinstance(handler, RawUpdateHandler):
-                                args = (update, users, chats)
-
-                            if args is None:
-                                continue
-
-                            try:
-                                if inspect.iscoroutinefunction(handler.callback):
-                                    await handler.callback(self.client, *args)
-                                else:
-                                    await self.loop.run_in_executor(
-                                        self.client.executor,
-                                        handler.callback,
-                                        self.client,
-                                        *args
-                                    )
-                            except pyrogram.StopPropagation:
-                                raise
-                            except pyrogram.ContinuePropagation:
-                                continue
-                            except Exception as e:
-                                executed = False
-                                if self.error_handlers:
-                                    for error_handler in self.error_handlers:
-                                        if isinstance(e, error_handler.errors):
-                                            executed = True
-                                            error_handler_coro = self.error_handler_coros[
-                                                self.error_handlers.index(error_handler)
-                                            ]
-                                            if error_handler_coro:
-                                                await error_handler.callback(self.client, e, *args)
-                                            else:
-                                                await self.loop.run_in_executor(
-                                                    self.client.executor,
-                                                    error_handler.callback,
-                                                    self.client,
-                                                    e,
-                                                    *args
-                                                )
-                                            continue
-                                if not executed or self.global_error_handler:
-                                    if self.global_error_handler_coro:
-                                        await self.global_error_handler.callback(self.client, e, *args)
-                                    else:
-                                        await self.loop.run_in_executor(
-                                            self.client.executor,
-                                            self.global_error_handler.callback,
-                                            self.client,
-                                            e,
-                                            *args
-                                        )
-                                else:
-                                    log.error(e, exc_info=True)
+                try:
+                    if handler._is_coro:
+                        await handler.callback(self.client, *args)
+                    else:
+                        if handler.run_sync_inline:
+                            result = handler.callback(self.client, *args)
+                        else:
+                            result = await self.loop.run_in_executor(
+                                self.client.executor,
+                                handler.callback,
+                                self.client,
+                                *args
+                            )
+
+                        if handler._is_coro is None:
+                            handler._is_coro = asyncio.iscoroutine(result)
+
+                            if handler._is_coro:
+                                await result
+                except pyrogram.StopPropagation:
+                    raise
+                except pyrogram.ContinuePropagation:
+                    continue
+                except Exception as e:
+                    error_handler = next(
+                        (
+                            self.error_dispatch[error_type]
+                            for error_type in type(e).__mro__
+                            if error_type in self.error_dispatch
+                        ),
+                        self.global_error_handler
+                    )
+
+                    if error_handler is None:
+                        log.error(e, exc_info=e)
+                    elif error_handler._is_coro:
+                        await error_handler.callback(self.client, e, *args)
+                    else:
+                        result = await self.loop.run_in_executor(
+                            self.client.executor,
+                            error_handler.callback,
+                            self.client,
+                            e,
+                            *args
+                        )
 
-                            break
-            except pyrogram.StopPropagation:
-                pass
-            except Exception as e:
-                log.error(e, exc_info=True)
+                        if error_handler._is_coro is None:
+                            error_handler._is_coro = asyncio.iscoroutine(result)
+
+                            if error_handler._is_coro:
+                                await result
+
+                break
@@ -38,6 +38,12 @@ class ChosenInlineResultHandler(Handler):
             Pass one or more filters to allow only a subset of chosen inline results to be passed
             in your callback function.
 
+        run_sync_inline (``bool``, *optional*):
+            Pass True to call a synchronous *callback* directly in the event loop instead of in the client executor.
+            This saves a thread switch per call, but blocks every other handler while it runs: only use it for cheap
+            callbacks that don't do any blocking work.
+            Defaults to False.
+
     Other parameters:
         client (:obj:`~pyrogram.Client`):
             The Client itself, useful when you want to call other API methods inside the message handler.
@@ -46,5 +52,5 @@ class ChosenInlineResultHandler(Handler):
             The received chosen inline result.
     """
 
-    def __init__(self, callback: Callable, filters=None):
-        super().__init__(callback, filters)
+    def __init__(self, callback: Callable, filters=None, run_sync_inline: bool = False):
+        super().__init__(callback, filters, run_sync_inline)
@@ -16,11 +16,11 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from .handler import Handler
 from typing import Callable
 
 import pyrogram
 from pyrogram.types import Update
+from .handler import Handler
 
 
 class ErrorHandler(Handler):
@@ -43,7 +43,8 @@ class ErrorHandler(Handler):
 
     def __init__(self, callback: Callable, errors=None):
         self.callback = callback
-        self.errors = tuple(errors) if isinstance(errors, list) else errors
+        self.errors = None if errors is None else (errors,) if isinstance(errors, type) else tuple(errors)
+        self._is_global = errors is None
     
     async def check(self, client: "pyrogram.Client", update: Update):
         return True
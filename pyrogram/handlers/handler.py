@@ -25,9 +25,10 @@ from pyrogram.types import Update
 
 
 class Handler:
-    def __init__(self, callback: Callable, filters: Filter = None):
+    def __init__(self, callback: Callable, filters: Filter = None, run_sync_inline: bool = False):
         self.callback = callback
         self.filters = filters
+        self.run_sync_inline = run_sync_inline
 
     async def check(self, client: "pyrogram.Client", update: Update):
         if callable(self.filters):
@@ -34,6 +34,12 @@ class RawUpdateHandler(Handler):
             *(client, update, users, chats)* as positional arguments (look at the section below for
             a detailed description).
 
+        run_sync_inline (``bool``, *optional*):
+            Pass True to call a synchronous *callback* directly in the event loop instead of in the client executor.
+            This saves a thread switch per call, but blocks every other handler while it runs: only use it for cheap
+            callbacks that don't do any blocking work.
+            Defaults to False.
+
     Other Parameters:
         client (:obj:`~pyrogram.Client`):
             The Client itself, useful when you want to call other API methods inside the update handler.
@@ -63,5 +69,5 @@ class RawUpdateHandler(Handler):
         - :obj:`~pyrogram.raw.types.ChannelForbidden`
     """
 
-    def __init__(self, callback: Callable):
-        super().__init__(callback)
+    def __init__(self, callback: Callable, run_sync_inline: bool = False):
+        super().__init__(callback, run_sync_inline=run_sync_inline)
@@ -26,7 +26,8 @@ class OnChatJoinRequest:
     def on_chat_join_request(
         self=None,
         filters=None,
-        group: int = 0
+        group: int = 0,
+        run_sync_inline: bool = False
     ) -> Callable:
         """Decorator for handling chat join requests.
 
@@ -39,18 +40,26 @@ class OnChatJoinRequest:
 
             group (``int``, *optional*):
                 The group identifier, defaults to 0.
+
+            run_sync_inline (``bool``, *optional*):
+                Pass True to call a synchronous function directly in the event loop instead of in the client
+                executor. Only use it for cheap functions that don't do any blocking work.
+                Defaults to False.
         """
 
         def decorator(func: Callable) -> Callable:
             if isinstance(self, pyrogram.Client):
-                self.add_handler(pyrogram.handlers.ChatJoinRequestHandler(func, filters), group)
+                self.add_handler(
+                    pyrogram.handlers.ChatJoinRequestHandler(func, filters, run_sync_inline=run_sync_inline),
+                    group
+                )
             elif isinstance(self, Filter) or self is None:
                 if not hasattr(func, "handlers"):
                     func.handlers = []
 
                 func.handlers.append(
                     (
-                        pyrogram.handlers.ChatJoinRequestHandler(func, self),
+                        pyrogram.handlers.ChatJoinRequestHandler(func, self, run_sync_inline=run_sync_inline),
                         group if filters is None else filters
                     )
                 )
@@ -26,7 +26,8 @@ class OnChatMemberUpdated:
     def on_chat_member_updated(
         self=None,
         filters=None,
-        group: int = 0
+        group: int = 0,
+        run_sync_inline: bool = False
     ) -> Callable:
         """Decorator for handling event changes on chat members.
 
@@ -39,18 +40,26 @@ class OnChatMemberUpdated:
 
             group (``int``, *optional*):
                 The group identifier, defaults to 0.
+
+            run_sync_inline (``bool``, *optional*):
+                Pass True to call a synchronous function directly in the event loop instead of in the client
+                executor. Only use it for cheap functions that don't do any blocking work.
+                Defaults to False.
         """
 
         def decorator(func: Callable) -> Callable:
             if isinstance(self, pyrogram.Client):
-                self.add_handler(pyrogram.handlers.ChatMemberUpdatedHandler(func, filters), group)
+                self.add_handler(
+                    pyrogram.handlers.ChatMemberUpdatedHandler(func, filters, run_sync_inline=run_sync_inline),
+                    group
+                )
             elif isinstance(self, Filter) or self is None:
                 if not hasattr(func, "handlers"):
                     func.handlers = []
 
                 func.handlers.append(
                     (
-                        pyrogram.handlers.ChatMemberUpdatedHandler(func, self),
+                        pyrogram.handlers.ChatMemberUpdatedHandler(func, self, run_sync_inline=run_sync_inline),
                         group if filters is None else filters
                     )
                 )
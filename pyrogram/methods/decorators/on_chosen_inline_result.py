@@ -26,7 +26,8 @@ class OnChosenInlineResult:
     def on_chosen_inline_result(
         self=None,
         filters=None,
-        group: int = 0
+        group: int = 0,
+        run_sync_inline: bool = False
     ) -> Callable:
         """Decorator for handling chosen inline results.
 
@@ -40,18 +41,26 @@ class OnChosenInlineResult:
 
             group (``int``, *optional*):
                 The group identifier, defaults to 0.
+
+            run_sync_inline (``bool``, *optional*):
+                Pass True to call a synchronous function directly in the event loop instead of in the client
+                executor. Only use it for cheap functions that don't do any blocking work.
+                Defaults to False.
         """
 
         def decorator(func: Callable) -> Callable:
             if isinstance(self, pyrogram.Client):
-                self.add_handler(pyrogram.handlers.ChosenInlineResultHandler(func, filters), group)
+                self.add_handler(
+                    pyrogram.handlers.ChosenInlineResultHandler(func, filters, run_sync_inline=run_sync_inline),
+                    group
+                )
             elif isinstance(self, Filter) or self is None:
                 if not hasattr(func, "handlers"):
                     func.handlers = []
 
                 func.handlers.append(
                     (
-                        pyrogram.handlers.ChosenInlineResultHandler(func, self),
+                        pyrogram.handlers.ChosenInlineResultHandler(func, self, run_sync_inline=run_sync_inline),
                         group if filters is None else filters
                     )
                 )
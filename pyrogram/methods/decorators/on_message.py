@@ -26,7 +26,8 @@ class OnMessage:
     def on_message(
         self=None,
         filters=None,
-        group: int = 0
+        group: int = 0,
+        run_sync_inline: bool = False
     ) -> Callable:
         """Decorator for handling new messages.
 
@@ -40,18 +41,26 @@ class OnMessage:
 
             group (``int``, *optional*):
                 The group identifier, defaults to 0.
+
+            run_sync_inline (``bool``, *optional*):
+                Pass True to call a synchronous function directly in the event loop instead of in the client
+                executor. Only use it for cheap functions that don't do any blocking work.
+                Defaults to False.
         """
 
         def decorator(func: Callable) -> Callable:
             if isinstance(self, pyrogram.Client):
-                self.add_handler(pyrogram.handlers.MessageHandler(func, filters), group)
+                self.add_handler(
+                    pyrogram.handlers.MessageHandler(func, filters, run_sync_inline=run_sync_inline),
+                    group
+                )
             elif isinstance(self, Filter) or self is None:
                 if not hasattr(func, "handlers"):
                     func.handlers = []
 
                 func.handlers.append(
                     (
-                        pyrogram.handlers.MessageHandler(func, self),
+                        pyrogram.handlers.MessageHandler(func, self, run_sync_inline=run_sync_inline),
                         group if filters is None else filters
                     )
                 )
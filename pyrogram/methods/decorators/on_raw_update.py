@@ -24,7 +24,8 @@ import pyrogram
 class OnRawUpdate:
     def on_raw_update(
         self=None,
-        group: int = 0
+        group: int = 0,
+        run_sync_inline: bool = False
     ) -> Callable:
         """Decorator for handling raw updates.
 
@@ -34,18 +35,23 @@ class OnRawUpdate:
         Parameters:
             group (``int``, *optional*):
                 The group identifier, defaults to 0.
+
+            run_sync_inline (``bool``, *optional*):
+                Pass True to call a synchronous function directly in the event loop instead of in the client
+                executor. Only use it for cheap functions that don't do any blocking work.
+                Defaults to False.
         """
 
         def decorator(func: Callable) -> Callable:
             if isinstance(self, pyrogram.Client):
-                self.add_handler(pyrogram.handlers.RawUpdateHandler(func), group)
+                self.add_handler(pyrogram.handlers.RawUpdateHandler(func, run_sync_inline=run_sync_inline), group)
             else:
                 if not hasattr(func, "handlers"):
                     func.handlers = []
 
                 func.handlers.append(
                     (
-                        pyrogram.handlers.RawUpdateHandler(func),
+                        pyrogram.handlers.RawUpdateHandler(func, run_sync_inline=run_sync_inline),
                         group if self is None else group
                     )
                 )
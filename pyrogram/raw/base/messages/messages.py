@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from typing import Union
+from pyrogram import raw
+from pyrogram.raw.core import TLObject
+
+Messages = Union[raw.types.messages.ChannelMessages, raw.types.messages.Messages, raw.types.messages.MessagesNotModified, raw.types.messages.MessagesSlice]
+
+
+# noinspection PyRedeclaration
+class Messages:  # type: ignore
+    """This base type has 4 constructors available.
+
+    Constructors:
+        .. hlist::
+            :columns: 2
+
+            - :obj:`messages.ChannelMessages <pyrogram.raw.types.messages.ChannelMessages>`
+            - :obj:`messages.Messages <pyrogram.raw.types.messages.Messages>`
+            - :obj:`messages.MessagesNotModified <pyrogram.raw.types.messages.MessagesNotModified>`
+            - :obj:`messages.MessagesSlice <pyrogram.raw.types.messages.MessagesSlice>`
+
+    See Also:
+        This object can be returned by 13 methods:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`messages.GetMessages <pyrogram.raw.functions.messages.GetMessages>`
+            - :obj:`messages.GetHistory <pyrogram.raw.functions.messages.GetHistory>`
+            - :obj:`messages.Search <pyrogram.raw.functions.messages.Search>`
+            - :obj:`messages.SearchGlobal <pyrogram.raw.functions.messages.SearchGlobal>`
+            - :obj:`messages.GetUnreadMentions <pyrogram.raw.functions.messages.GetUnreadMentions>`
+            - :obj:`messages.GetRecentLocations <pyrogram.raw.functions.messages.GetRecentLocations>`
+            - :obj:`messages.GetScheduledHistory <pyrogram.raw.functions.messages.GetScheduledHistory>`
+            - :obj:`messages.GetScheduledMessages <pyrogram.raw.functions.messages.GetScheduledMessages>`
+            - :obj:`messages.GetReplies <pyrogram.raw.functions.messages.GetReplies>`
+            - :obj:`messages.GetUnreadReactions <pyrogram.raw.functions.messages.GetUnreadReactions>`
+            - :obj:`messages.SearchSentMedia <pyrogram.raw.functions.messages.SearchSentMedia>`
+            - :obj:`channels.GetMessages <pyrogram.raw.functions.channels.GetMessages>`
+            - :obj:`stats.GetMessagePublicForwards <pyrogram.raw.functions.stats.GetMessagePublicForwards>`
+    """
+
+    QUALNAME = "pyrogram.raw.base.messages.Messages"
+
+    def __init__(self):
+        raise TypeError("Base types can only be used for type checking purposes: "
+                        "you tried to use a base type instance as argument, "
+                        "but you need to instantiate one of its constructors instead. "
+                        "More info: https://docs.pyrogram.org/telegram/base/messages")
@@ -0,0 +1,58 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from typing import Union
+from pyrogram import raw
+from pyrogram.raw.core import TLObject
+
+ReportReason = Union[raw.types.InputReportReasonChildAbuse, raw.types.InputReportReasonCopyright, raw.types.InputReportReasonFake, raw.types.InputReportReasonGeoIrrelevant, raw.types.InputReportReasonIllegalDrugs, raw.types.InputReportReasonOther, raw.types.InputReportReasonPersonalDetails, raw.types.InputReportReasonPornography, raw.types.InputReportReasonSpam, raw.types.InputReportReasonViolence]
+
+
+# noinspection PyRedeclaration
+class ReportReason:  # type: ignore
+    """This base type has 10 constructors available.
+
+    Constructors:
+        .. hlist::
+            :columns: 2
+
+            - :obj:`InputReportReasonChildAbuse <pyrogram.raw.types.InputReportReasonChildAbuse>`
+            - :obj:`InputReportReasonCopyright <pyrogram.raw.types.InputReportReasonCopyright>`
+            - :obj:`InputReportReasonFake <pyrogram.raw.types.InputReportReasonFake>`
+            - :obj:`InputReportReasonGeoIrrelevant <pyrogram.raw.types.InputReportReasonGeoIrrelevant>`
+            - :obj:`InputReportReasonIllegalDrugs <pyrogram.raw.types.InputReportReasonIllegalDrugs>`
+            - :obj:`InputReportReasonOther <pyrogram.raw.types.InputReportReasonOther>`
+            - :obj:`InputReportReasonPersonalDetails <pyrogram.raw.types.InputReportReasonPersonalDetails>`
+            - :obj:`InputReportReasonPornography <pyrogram.raw.types.InputReportReasonPornography>`
+            - :obj:`InputReportReasonSpam <pyrogram.raw.types.InputReportReasonSpam>`
+            - :obj:`InputReportReasonViolence <pyrogram.raw.types.InputReportReasonViolence>`
+    """
+
+    QUALNAME = "pyrogram.raw.base.ReportReason"
+
+    def __init__(self):
+        raise TypeError("Base types can only be used for type checking purposes: "
+                        "you tried to use a base type instance as argument, "
+                        "but you need to instantiate one of its constructors instead. "
+                        "More info: https://docs.pyrogram.org/telegram/base/report-reason")
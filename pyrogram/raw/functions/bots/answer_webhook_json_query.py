@@ -0,0 +1,77 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class AnswerWebhookJSONQuery(TLObject):  # type: ignore
+    """Telegram API method.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``E6213F4D``
+
+    Parameters:
+        query_id: ``int`` ``64-bit``
+        data: :obj:`DataJSON <pyrogram.raw.base.DataJSON>`
+
+    Returns:
+        ``bool``
+    """
+
+    __slots__: List[str] = ["query_id", "data"]
+
+    ID = 0xe6213f4d
+    QUALNAME = "functions.bots.AnswerWebhookJSONQuery"
+
+    def __init__(self, *, query_id: int, data: "raw.base.DataJSON") -> None:
+        self.query_id = query_id  # long
+        self.data = data  # DataJSON
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "AnswerWebhookJSONQuery":
+        # No flags
+        
+        query_id = Long.read(b)
+        
+        data = TLObject.read(b)
+        
+        return AnswerWebhookJSONQuery(query_id=query_id, data=data)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.query_id))
+        
+        b.write(self.data.write())
+        
+        return b.getvalue()
@@ -0,0 +1,106 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class CreateChannel(TLObject):  # type: ignore
+    """Telegram API method.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``3D5FB10F``
+
+    Parameters:
+        title: ``str``
+        about: ``str``
+        broadcast (optional): ``bool``
+        megagroup (optional): ``bool``
+        for_import (optional): ``bool``
+        geo_point (optional): :obj:`InputGeoPoint <pyrogram.raw.base.InputGeoPoint>`
+        address (optional): ``str``
+
+    Returns:
+        :obj:`Updates <pyrogram.raw.base.Updates>`
+    """
+
+    __slots__: List[str] = ["title", "about", "broadcast", "megagroup", "for_import", "geo_point", "address"]
+
+    ID = 0x3d5fb10f
+    QUALNAME = "functions.channels.CreateChannel"
+
+    def __init__(self, *, title: str, about: str, broadcast: Optional[bool] = None, megagroup: Optional[bool] = None, for_import: Optional[bool] = None, geo_point: "raw.base.InputGeoPoint" = None, address: Optional[str] = None) -> None:
+        self.title = title  # string
+        self.about = about  # string
+        self.broadcast = broadcast  # flags.0?true
+        self.megagroup = megagroup  # flags.1?true
+        self.for_import = for_import  # flags.3?true
+        self.geo_point = geo_point  # flags.2?InputGeoPoint
+        self.address = address  # flags.2?string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "CreateChannel":
+        
+        flags = Int.read(b)
+        
+        broadcast = True if flags & (1 << 0) else False
+        megagroup = True if flags & (1 << 1) else False
+        for_import = True if flags & (1 << 3) else False
+        title = String.read(b)
+        
+        about = String.read(b)
+        
+        geo_point = TLObject.read(b) if flags & (1 << 2) else None
+        
+        address = String.read(b) if flags & (1 << 2) else None
+        return CreateChannel(title=title, about=about, broadcast=broadcast, megagroup=megagroup, for_import=for_import, geo_point=geo_point, address=address)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.broadcast else 0
+        flags |= (1 << 1) if self.megagroup else 0
+        flags |= (1 << 3) if self.for_import else 0
+        flags |= (1 << 2) if self.geo_point is not None else 0
+        flags |= (1 << 2) if self.address is not None else 0
+        b.write(Int(flags))
+        
+        b.write(String(self.title))
+        
+        b.write(String(self.about))
+        
+        if self.geo_point is not None:
+            b.write(self.geo_point.write())
+        
+        if self.address is not None:
+            b.write(String(self.address))
+        
+        return b.getvalue()
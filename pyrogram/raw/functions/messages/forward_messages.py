@@ -0,0 +1,130 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ForwardMessages(TLObject):  # type: ignore
+    """Telegram API method.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``CC30290B``
+
+    Parameters:
+        from_peer: :obj:`InputPeer <pyrogram.raw.base.InputPeer>`
+        id: List of ``int`` ``32-bit``
+        random_id: List of ``int`` ``64-bit``
+        to_peer: :obj:`InputPeer <pyrogram.raw.base.InputPeer>`
+        silent (optional): ``bool``
+        background (optional): ``bool``
+        with_my_score (optional): ``bool``
+        drop_author (optional): ``bool``
+        drop_media_captions (optional): ``bool``
+        noforwards (optional): ``bool``
+        schedule_date (optional): ``int`` ``32-bit``
+        send_as (optional): :obj:`InputPeer <pyrogram.raw.base.InputPeer>`
+
+    Returns:
+        :obj:`Updates <pyrogram.raw.base.Updates>`
+    """
+
+    __slots__: List[str] = ["from_peer", "id", "random_id", "to_peer", "silent", "background", "with_my_score", "drop_author", "drop_media_captions", "noforwards", "schedule_date", "send_as"]
+
+    ID = 0xcc30290b
+    QUALNAME = "functions.messages.ForwardMessages"
+
+    def __init__(self, *, from_peer: "raw.base.InputPeer", id: List[int], random_id: List[int], to_peer: "raw.base.InputPeer", silent: Optional[bool] = None, background: Optional[bool] = None, with_my_score: Optional[bool] = None, drop_author: Optional[bool] = None, drop_media_captions: Optional[bool] = None, noforwards: Optional[bool] = None, schedule_date: Optional[int] = None, send_as: "raw.base.InputPeer" = None) -> None:
+        self.from_peer = from_peer  # InputPeer
+        self.id = id  # Vector<int>
+        self.random_id = random_id  # Vector<long>
+        self.to_peer = to_peer  # InputPeer
+        self.silent = silent  # flags.5?true
+        self.background = background  # flags.6?true
+        self.with_my_score = with_my_score  # flags.8?true
+        self.drop_author = drop_author  # flags.11?true
+        self.drop_media_captions = drop_media_captions  # flags.12?true
+        self.noforwards = noforwards  # flags.14?true
+        self.schedule_date = schedule_date  # flags.10?int
+        self.send_as = send_as  # flags.13?InputPeer
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ForwardMessages":
+        
+        flags = Int.read(b)
+        
+        silent = True if flags & (1 << 5) else False
+        background = True if flags & (1 << 6) else False
+        with_my_score = True if flags & (1 << 8) else False
+        drop_author = True if flags & (1 << 11) else False
+        drop_media_captions = True if flags & (1 << 12) else False
+        noforwards = True if flags & (1 << 14) else False
+        from_peer = TLObject.read(b)
+        
+        id = TLObject.read(b, Int)
+        
+        random_id = TLObject.read(b, Long)
+        
+        to_peer = TLObject.read(b)
+        
+        schedule_date = Int.read(b) if flags & (1 << 10) else None
+        send_as = TLObject.read(b) if flags & (1 << 13) else None
+        
+        return ForwardMessages(from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, schedule_date=schedule_date, send_as=send_as)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 5) if self.silent else 0
+        flags |= (1 << 6) if self.background else 0
+        flags |= (1 << 8) if self.with_my_score else 0
+        flags |= (1 << 11) if self.drop_author else 0
+        flags |= (1 << 12) if self.drop_media_captions else 0
+        flags |= (1 << 14) if self.noforwards else 0
+        flags |= (1 << 10) if self.schedule_date is not None else 0
+        flags |= (1 << 13) if self.send_as is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.from_peer.write())
+        
+        b.write(Vector(self.id, Int))
+        
+        b.write(Vector(self.random_id, Long))
+        
+        b.write(self.to_peer.write())
+        
+        if self.schedule_date is not None:
+            b.write(Int(self.schedule_date))
+        
+        if self.send_as is not None:
+            b.write(self.send_as.write())
+        
+        return b.getvalue()
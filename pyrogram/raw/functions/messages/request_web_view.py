@@ -0,0 +1,116 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class RequestWebView(TLObject):  # type: ignore
+    """Telegram API method.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``FA04DFF``
+
+    Parameters:
+        peer: :obj:`InputPeer <pyrogram.raw.base.InputPeer>`
+        bot: :obj:`InputUser <pyrogram.raw.base.InputUser>`
+        from_bot_menu (optional): ``bool``
+        silent (optional): ``bool``
+        url (optional): ``str``
+        start_param (optional): ``str``
+        theme_params (optional): :obj:`DataJSON <pyrogram.raw.base.DataJSON>`
+        reply_to_msg_id (optional): ``int`` ``32-bit``
+
+    Returns:
+        :obj:`WebViewResult <pyrogram.raw.base.WebViewResult>`
+    """
+
+    __slots__: List[str] = ["peer", "bot", "from_bot_menu", "silent", "url", "start_param", "theme_params", "reply_to_msg_id"]
+
+    ID = 0xfa04dff
+    QUALNAME = "functions.messages.RequestWebView"
+
+    def __init__(self, *, peer: "raw.base.InputPeer", bot: "raw.base.InputUser", from_bot_menu: Optional[bool] = None, silent: Optional[bool] = None, url: Optional[str] = None, start_param: Optional[str] = None, theme_params: "raw.base.DataJSON" = None, reply_to_msg_id: Optional[int] = None) -> None:
+        self.peer = peer  # InputPeer
+        self.bot = bot  # InputUser
+        self.from_bot_menu = from_bot_menu  # flags.4?true
+        self.silent = silent  # flags.5?true
+        self.url = url  # flags.1?string
+        self.start_param = start_param  # flags.3?string
+        self.theme_params = theme_params  # flags.2?DataJSON
+        self.reply_to_msg_id = reply_to_msg_id  # flags.0?int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "RequestWebView":
+        
+        flags = Int.read(b)
+        
+        from_bot_menu = True if flags & (1 << 4) else False
+        silent = True if flags & (1 << 5) else False
+        peer = TLObject.read(b)
+        
+        bot = TLObject.read(b)
+        
+        url = String.read(b) if flags & (1 << 1) else None
+        start_param = String.read(b) if flags & (1 << 3) else None
+        theme_params = TLObject.read(b) if flags & (1 << 2) else None
+        
+        reply_to_msg_id = Int.read(b) if flags & (1 << 0) else None
+        return RequestWebView(peer=peer, bot=bot, from_bot_menu=from_bot_menu, silent=silent, url=url, start_param=start_param, theme_params=theme_params, reply_to_msg_id=reply_to_msg_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 4) if self.from_bot_menu else 0
+        flags |= (1 << 5) if self.silent else 0
+        flags |= (1 << 1) if self.url is not None else 0
+        flags |= (1 << 3) if self.start_param is not None else 0
+        flags |= (1 << 2) if self.theme_params is not None else 0
+        flags |= (1 << 0) if self.reply_to_msg_id is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.peer.write())
+        
+        b.write(self.bot.write())
+        
+        if self.url is not None:
+            b.write(String(self.url))
+        
+        if self.start_param is not None:
+            b.write(String(self.start_param))
+        
+        if self.theme_params is not None:
+            b.write(self.theme_params.write())
+        
+        if self.reply_to_msg_id is not None:
+            b.write(Int(self.reply_to_msg_id))
+        
+        return b.getvalue()
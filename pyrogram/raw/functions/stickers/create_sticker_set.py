@@ -0,0 +1,118 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class CreateStickerSet(TLObject):  # type: ignore
+    """Telegram API method.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``9021AB67``
+
+    Parameters:
+        user_id: :obj:`InputUser <pyrogram.raw.base.InputUser>`
+        title: ``str``
+        short_name: ``str``
+        stickers: List of :obj:`InputStickerSetItem <pyrogram.raw.base.InputStickerSetItem>`
+        masks (optional): ``bool``
+        animated (optional): ``bool``
+        videos (optional): ``bool``
+        thumb (optional): :obj:`InputDocument <pyrogram.raw.base.InputDocument>`
+        software (optional): ``str``
+
+    Returns:
+        :obj:`messages.StickerSet <pyrogram.raw.base.messages.StickerSet>`
+    """
+
+    __slots__: List[str] = ["user_id", "title", "short_name", "stickers", "masks", "animated", "videos", "thumb", "software"]
+
+    ID = 0x9021ab67
+    QUALNAME = "functions.stickers.CreateStickerSet"
+
+    def __init__(self, *, user_id: "raw.base.InputUser", title: str, short_name: str, stickers: List["raw.base.InputStickerSetItem"], masks: Optional[bool] = None, animated: Optional[bool] = None, videos: Optional[bool] = None, thumb: "raw.base.InputDocument" = None, software: Optional[str] = None) -> None:
+        self.user_id = user_id  # InputUser
+        self.title = title  # string
+        self.short_name = short_name  # string
+        self.stickers = stickers  # Vector<InputStickerSetItem>
+        self.masks = masks  # flags.0?true
+        self.animated = animated  # flags.1?true
+        self.videos = videos  # flags.4?true
+        self.thumb = thumb  # flags.2?InputDocument
+        self.software = software  # flags.3?string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "CreateStickerSet":
+        
+        flags = Int.read(b)
+        
+        masks = True if flags & (1 << 0) else False
+        animated = True if flags & (1 << 1) else False
+        videos = True if flags & (1 << 4) else False
+        user_id = TLObject.read(b)
+        
+        title = String.read(b)
+        
+        short_name = String.read(b)
+        
+        thumb = TLObject.read(b) if flags & (1 << 2) else None
+        
+        stickers = TLObject.read(b)
+        
+        software = String.read(b) if flags & (1 << 3) else None
+        return CreateStickerSet(user_id=user_id, title=title, short_name=short_name, stickers=stickers, masks=masks, animated=animated, videos=videos, thumb=thumb, software=software)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.masks else 0
+        flags |= (1 << 1) if self.animated else 0
+        flags |= (1 << 4) if self.videos else 0
+        flags |= (1 << 2) if self.thumb is not None else 0
+        flags |= (1 << 3) if self.software is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.user_id.write())
+        
+        b.write(String(self.title))
+        
+        b.write(String(self.short_name))
+        
+        if self.thumb is not None:
+            b.write(self.thumb.write())
+        
+        b.write(Vector(self.stickers))
+        
+        if self.software is not None:
+            b.write(String(self.software))
+        
+        return b.getvalue()
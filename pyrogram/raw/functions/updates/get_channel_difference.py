@@ -0,0 +1,95 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetChannelDifference(TLObject):  # type: ignore
+    """Telegram API method.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``3173D78``
+
+    Parameters:
+        channel: :obj:`InputChannel <pyrogram.raw.base.InputChannel>`
+        filter: :obj:`ChannelMessagesFilter <pyrogram.raw.base.ChannelMessagesFilter>`
+        pts: ``int`` ``32-bit``
+        limit: ``int`` ``32-bit``
+        force (optional): ``bool``
+
+    Returns:
+        :obj:`updates.ChannelDifference <pyrogram.raw.base.updates.ChannelDifference>`
+    """
+
+    __slots__: List[str] = ["channel", "filter", "pts", "limit", "force"]
+
+    ID = 0x3173d78
+    QUALNAME = "functions.updates.GetChannelDifference"
+
+    def __init__(self, *, channel: "raw.base.InputChannel", filter: "raw.base.ChannelMessagesFilter", pts: int, limit: int, force: Optional[bool] = None) -> None:
+        self.channel = channel  # InputChannel
+        self.filter = filter  # ChannelMessagesFilter
+        self.pts = pts  # int
+        self.limit = limit  # int
+        self.force = force  # flags.0?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetChannelDifference":
+        
+        flags = Int.read(b)
+        
+        force = True if flags & (1 << 0) else False
+        channel = TLObject.read(b)
+        
+        filter = TLObject.read(b)
+        
+        pts = Int.read(b)
+        
+        limit = Int.read(b)
+        
+        return GetChannelDifference(channel=channel, filter=filter, pts=pts, limit=limit, force=force)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.force else 0
+        b.write(Int(flags))
+        
+        b.write(self.channel.write())
+        
+        b.write(self.filter.write())
+        
+        b.write(Int(self.pts))
+        
+        b.write(Int(self.limit))
+        
+        return b.getvalue()
@@ -0,0 +1,77 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetFileHashes(TLObject):  # type: ignore
+    """Telegram API method.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``C7025931``
+
+    Parameters:
+        location: :obj:`InputFileLocation <pyrogram.raw.base.InputFileLocation>`
+        offset: ``int`` ``32-bit``
+
+    Returns:
+        List of :obj:`FileHash <pyrogram.raw.base.FileHash>`
+    """
+
+    __slots__: List[str] = ["location", "offset"]
+
+    ID = 0xc7025931
+    QUALNAME = "functions.upload.GetFileHashes"
+
+    def __init__(self, *, location: "raw.base.InputFileLocation", offset: int) -> None:
+        self.location = location  # InputFileLocation
+        self.offset = offset  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetFileHashes":
+        # No flags
+        
+        location = TLObject.read(b)
+        
+        offset = Int.read(b)
+        
+        return GetFileHashes(location=location, offset=offset)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.location.write())
+        
+        b.write(Int(self.offset))
+        
+        return b.getvalue()
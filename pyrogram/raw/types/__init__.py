@@ -0,0 +1,860 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .res_pq import ResPQ
+from .pq_inner_data import PQInnerData
+from .pq_inner_data_dc import PQInnerDataDc
+from .pq_inner_data_temp import PQInnerDataTemp
+from .pq_inner_data_temp_dc import PQInnerDataTempDc
+from .bind_auth_key_inner import BindAuthKeyInner
+from .server_dh_params_fail import ServerDHParamsFail
+from .server_dh_params_ok import ServerDHParamsOk
+from .server_dh_inner_data import ServerDHInnerData
+from .client_dh_inner_data import ClientDHInnerData
+from .dh_gen_ok import DhGenOk
+from .dh_gen_retry import DhGenRetry
+from .dh_gen_fail import DhGenFail
+from .destroy_auth_key_ok import DestroyAuthKeyOk
+from .destroy_auth_key_none import DestroyAuthKeyNone
+from .destroy_auth_key_fail import DestroyAuthKeyFail
+from .msgs_ack import MsgsAck
+from .bad_msg_notification import BadMsgNotification
+from .bad_server_salt import BadServerSalt
+from .msgs_state_req import MsgsStateReq
+from .msgs_state_info import MsgsStateInfo
+from .msgs_all_info import MsgsAllInfo
+from .msg_detailed_info import MsgDetailedInfo
+from .msg_new_detailed_info import MsgNewDetailedInfo
+from .msg_resend_req import MsgResendReq
+from .msg_resend_ans_req import MsgResendAnsReq
+from .rpc_result import RpcResult
+from .rpc_error import RpcError
+from .rpc_answer_unknown import RpcAnswerUnknown
+from .rpc_answer_dropped_running import RpcAnswerDroppedRunning
+from .rpc_answer_dropped import RpcAnswerDropped
+from .pong import Pong
+from .destroy_session_ok import DestroySessionOk
+from .destroy_session_none import DestroySessionNone
+from .new_session_created import NewSessionCreated
+from .http_wait import HttpWait
+from .ip_port import IpPort
+from .ip_port_secret import IpPortSecret
+from .access_point_rule import AccessPointRule
+from .input_peer_empty import InputPeerEmpty
+from .input_peer_self import InputPeerSelf
+from .input_peer_chat import InputPeerChat
+from .input_peer_user import InputPeerUser
+from .input_peer_channel import InputPeerChannel
+from .input_peer_user_from_message import InputPeerUserFromMessage
+from .input_peer_channel_from_message import InputPeerChannelFromMessage
+from .input_user_empty import InputUserEmpty
+from .input_user_self import InputUserSelf
+from .input_user import InputUser
+from .input_user_from_message import InputUserFromMessage
+from .input_phone_contact import InputPhoneContact
+from .input_file import InputFile
+from .input_file_big import InputFileBig
+from .input_media_empty import InputMediaEmpty
+from .input_media_uploaded_photo import InputMediaUploadedPhoto
+from .input_media_photo import InputMediaPhoto
+from .input_media_geo_point import InputMediaGeoPoint
+from .input_media_contact import InputMediaContact
+from .input_media_uploaded_document import InputMediaUploadedDocument
+from .input_media_document import InputMediaDocument
+from .input_media_venue import InputMediaVenue
+from .input_media_photo_external import InputMediaPhotoExternal
+from .input_media_document_external import InputMediaDocumentExternal
+from .input_media_game import InputMediaGame
+from .input_media_invoice import InputMediaInvoice
+from .input_media_geo_live import InputMediaGeoLive
+from .input_media_poll import InputMediaPoll
+from .input_media_dice import InputMediaDice
+from .input_chat_photo_empty import InputChatPhotoEmpty
+from .input_chat_uploaded_photo import InputChatUploadedPhoto
+from .input_chat_photo import InputChatPhoto
+from .input_geo_point_empty import InputGeoPointEmpty
+from .input_geo_point import InputGeoPoint
+from .input_photo_empty import InputPhotoEmpty
+from .input_photo import InputPhoto
+from .input_file_location import InputFileLocation
+from .input_encrypted_file_location import InputEncryptedFileLocation
+from .input_document_file_location import InputDocumentFileLocation
+from .input_secure_file_location import InputSecureFileLocation
+from .input_takeout_file_location import InputTakeoutFileLocation
+from .input_photo_file_location import InputPhotoFileLocation
+from .input_photo_legacy_file_location import InputPhotoLegacyFileLocation
+from .input_peer_photo_file_location import InputPeerPhotoFileLocation
+from .input_sticker_set_thumb import InputStickerSetThumb
+from .input_group_call_stream import InputGroupCallStream
+from .peer_user import PeerUser
+from .peer_chat import PeerChat
+from .peer_channel import PeerChannel
+from .user_empty import UserEmpty
+from .user import User
+from .user_profile_photo_empty import UserProfilePhotoEmpty
+from .user_profile_photo import UserProfilePhoto
+from .user_status_empty import UserStatusEmpty
+from .user_status_online import UserStatusOnline
+from .user_status_offline import UserStatusOffline
+from .user_status_recently import UserStatusRecently
+from .user_status_last_week import UserStatusLastWeek
+from .user_status_last_month import UserStatusLastMonth
+from .chat_empty import ChatEmpty
+from .chat import Chat
+from .chat_forbidden import ChatForbidden
+from .channel import Channel
+from .channel_forbidden import ChannelForbidden
+from .chat_full import ChatFull
+from .channel_full import ChannelFull
+from .chat_participant import ChatParticipant
+from .chat_participant_creator import ChatParticipantCreator
+from .chat_participant_admin import ChatParticipantAdmin
+from .chat_participants_forbidden import ChatParticipantsForbidden
+from .chat_participants import ChatParticipants
+from .chat_photo_empty import ChatPhotoEmpty
+from .chat_photo import ChatPhoto
+from .message_empty import MessageEmpty
+from .message import Message
+from .message_service import MessageService
+from .message_media_empty import MessageMediaEmpty
+from .message_media_photo import MessageMediaPhoto
+from .message_media_geo import MessageMediaGeo
+from .message_media_contact import MessageMediaContact
+from .message_media_unsupported import MessageMediaUnsupported
+from .message_media_document import MessageMediaDocument
+from .message_media_web_page import MessageMediaWebPage
+from .message_media_venue import MessageMediaVenue
+from .message_media_game import MessageMediaGame
+from .message_media_invoice import MessageMediaInvoice
+from .message_media_geo_live import MessageMediaGeoLive
+from .message_media_poll import MessageMediaPoll
+from .message_media_dice import MessageMediaDice
+from .message_action_empty import MessageActionEmpty
+from .message_action_chat_create import MessageActionChatCreate
+from .message_action_chat_edit_title import MessageActionChatEditTitle
+from .message_action_chat_edit_photo import MessageActionChatEditPhoto
+from .message_action_chat_delete_photo import MessageActionChatDeletePhoto
+from .message_action_chat_add_user import MessageActionChatAddUser
+from .message_action_chat_delete_user import MessageActionChatDeleteUser
+from .message_action_chat_joined_by_link import MessageActionChatJoinedByLink
+from .message_action_channel_create import MessageActionChannelCreate
+from .message_action_chat_migrate_to import MessageActionChatMigrateTo
+from .message_action_channel_migrate_from import MessageActionChannelMigrateFrom
+from .message_action_pin_message import MessageActionPinMessage
+from .message_action_history_clear import MessageActionHistoryClear
+from .message_action_game_score import MessageActionGameScore
+from .message_action_payment_sent_me import MessageActionPaymentSentMe
+from .message_action_payment_sent import MessageActionPaymentSent
+from .message_action_phone_call import MessageActionPhoneCall
+from .message_action_screenshot_taken import MessageActionScreenshotTaken
+from .message_action_custom_action import MessageActionCustomAction
+from .message_action_bot_allowed import MessageActionBotAllowed
+from .message_action_secure_values_sent_me import MessageActionSecureValuesSentMe
+from .message_action_secure_values_sent import MessageActionSecureValuesSent
+from .message_action_contact_sign_up import MessageActionContactSignUp
+from .message_action_geo_proximity_reached import MessageActionGeoProximityReached
+from .message_action_group_call import MessageActionGroupCall
+from .message_action_invite_to_group_call import MessageActionInviteToGroupCall
+from .message_action_set_messages_ttl import MessageActionSetMessagesTTL
+from .message_action_group_call_scheduled import MessageActionGroupCallScheduled
+from .message_action_set_chat_theme import MessageActionSetChatTheme
+from .message_action_chat_joined_by_request import MessageActionChatJoinedByRequest
+from .message_action_web_view_data_sent_me import MessageActionWebViewDataSentMe
+from .message_action_web_view_data_sent import MessageActionWebViewDataSent
+from .dialog import Dialog
+from .dialog_folder import DialogFolder
+from .photo_empty import PhotoEmpty
+from .photo import Photo
+from .photo_size_empty import PhotoSizeEmpty
+from .photo_size import PhotoSize
+from .photo_cached_size import PhotoCachedSize
+from .photo_stripped_size import PhotoStrippedSize
+from .photo_size_progressive import PhotoSizeProgressive
+from .photo_path_size import PhotoPathSize
+from .geo_point_empty import GeoPointEmpty
+from .geo_point import GeoPoint
+from .input_notify_peer import InputNotifyPeer
+from .input_notify_users import InputNotifyUsers
+from .input_notify_chats import InputNotifyChats
+from .input_notify_broadcasts import InputNotifyBroadcasts
+from .input_peer_notify_settings import InputPeerNotifySettings
+from .peer_notify_settings import PeerNotifySettings
+from .peer_settings import PeerSettings
+from .wall_paper import WallPaper
+from .wall_paper_no_file import WallPaperNoFile
+from .input_report_reason_spam import InputReportReasonSpam
+from .input_report_reason_violence import InputReportReasonViolence
+from .input_report_reason_pornography import InputReportReasonPornography
+from .input_report_reason_child_abuse import InputReportReasonChildAbuse
+from .input_report_reason_other import InputReportReasonOther
+from .input_report_reason_copyright import InputReportReasonCopyright
+from .input_report_reason_geo_irrelevant import InputReportReasonGeoIrrelevant
+from .input_report_reason_fake import InputReportReasonFake
+from .input_report_reason_illegal_drugs import InputReportReasonIllegalDrugs
+from .input_report_reason_personal_details import InputReportReasonPersonalDetails
+from .user_full import UserFull
+from .contact import Contact
+from .imported_contact import ImportedContact
+from .contact_status import ContactStatus
+from .input_messages_filter_empty import InputMessagesFilterEmpty
+from .input_messages_filter_photos import InputMessagesFilterPhotos
+from .input_messages_filter_video import InputMessagesFilterVideo
+from .input_messages_filter_photo_video import InputMessagesFilterPhotoVideo
+from .input_messages_filter_document import InputMessagesFilterDocument
+from .input_messages_filter_url import InputMessagesFilterUrl
+from .input_messages_filter_gif import InputMessagesFilterGif
+from .input_messages_filter_voice import InputMessagesFilterVoice
+from .input_messages_filter_music import InputMessagesFilterMusic
+from .input_messages_filter_chat_photos import InputMessagesFilterChatPhotos
+from .input_messages_filter_phone_calls import InputMessagesFilterPhoneCalls
+from .input_messages_filter_round_voice import InputMessagesFilterRoundVoice
+from .input_messages_filter_round_video import InputMessagesFilterRoundVideo
+from .input_messages_filter_my_mentions import InputMessagesFilterMyMentions
+from .input_messages_filter_geo import InputMessagesFilterGeo
+from .input_messages_filter_contacts import InputMessagesFilterContacts
+from .input_messages_filter_pinned import InputMessagesFilterPinned
+from .update_new_message import UpdateNewMessage
+from .update_message_id import UpdateMessageID
+from .update_delete_messages import UpdateDeleteMessages
+from .update_user_typing import UpdateUserTyping
+from .update_chat_user_typing import UpdateChatUserTyping
+from .update_chat_participants import UpdateChatParticipants
+from .update_user_status import UpdateUserStatus
+from .update_user_name import UpdateUserName
+from .update_user_photo import UpdateUserPhoto
+from .update_new_encrypted_message import UpdateNewEncryptedMessage
+from .update_encrypted_chat_typing import UpdateEncryptedChatTyping
+from .update_encryption import UpdateEncryption
+from .update_encrypted_messages_read import UpdateEncryptedMessagesRead
+from .update_chat_participant_add import UpdateChatParticipantAdd
+from .update_chat_participant_delete import UpdateChatParticipantDelete
+from .update_dc_options import UpdateDcOptions
+from .update_notify_settings import UpdateNotifySettings
+from .update_service_notification import UpdateServiceNotification
+from .update_privacy import UpdatePrivacy
+from .update_user_phone import UpdateUserPhone
+from .update_read_history_inbox import UpdateReadHistoryInbox
+from .update_read_history_outbox import UpdateReadHistoryOutbox
+from .update_web_page import UpdateWebPage
+from .update_read_messages_contents import UpdateReadMessagesContents
+from .update_channel_too_long import UpdateChannelTooLong
+from .update_channel import UpdateChannel
+from .update_new_channel_message import UpdateNewChannelMessage
+from .update_read_channel_inbox import UpdateReadChannelInbox
+from .update_delete_channel_messages import UpdateDeleteChannelMessages
+from .update_channel_message_views import UpdateChannelMessageViews
+from .update_chat_participant_admin import UpdateChatParticipantAdmin
+from .update_new_sticker_set import UpdateNewStickerSet
+from .update_sticker_sets_order import UpdateStickerSetsOrder
+from .update_sticker_sets import UpdateStickerSets
+from .update_saved_gifs import UpdateSavedGifs
+from .update_bot_inline_query import UpdateBotInlineQuery
+from .update_bot_inline_send import UpdateBotInlineSend
+from .update_edit_channel_message import UpdateEditChannelMessage
+from .update_bot_callback_query import UpdateBotCallbackQuery
+from .update_edit_message import UpdateEditMessage
+from .update_inline_bot_callback_query import UpdateInlineBotCallbackQuery
+from .update_read_channel_outbox import UpdateReadChannelOutbox
+from .update_draft_message import UpdateDraftMessage
+from .update_read_featured_stickers import UpdateReadFeaturedStickers
+from .update_recent_stickers import UpdateRecentStickers
+from .update_config import UpdateConfig
+from .update_pts_changed import UpdatePtsChanged
+from .update_channel_web_page import UpdateChannelWebPage
+from .update_dialog_pinned import UpdateDialogPinned
+from .update_pinned_dialogs import UpdatePinnedDialogs
+from .update_bot_webhook_json import UpdateBotWebhookJSON
+from .update_bot_webhook_json_query import UpdateBotWebhookJSONQuery
+from .update_bot_shipping_query import UpdateBotShippingQuery
+from .update_bot_precheckout_query import UpdateBotPrecheckoutQuery
+from .update_phone_call import UpdatePhoneCall
+from .update_lang_pack_too_long import UpdateLangPackTooLong
+from .update_lang_pack import UpdateLangPack
+from .update_faved_stickers import UpdateFavedStickers
+from .update_channel_read_messages_contents import UpdateChannelReadMessagesContents
+from .update_contacts_reset import UpdateContactsReset
+from .update_channel_available_messages import UpdateChannelAvailableMessages
+from .update_dialog_unread_mark import UpdateDialogUnreadMark
+from .update_message_poll import UpdateMessagePoll
+from .update_chat_default_banned_rights import UpdateChatDefaultBannedRights
+from .update_folder_peers import UpdateFolderPeers
+from .update_peer_settings import UpdatePeerSettings
+from .update_peer_located import UpdatePeerLocated
+from .update_new_scheduled_message import UpdateNewScheduledMessage
+from .update_delete_scheduled_messages import UpdateDeleteScheduledMessages
+from .update_theme import UpdateTheme
+from .update_geo_live_viewed import UpdateGeoLiveViewed
+from .update_login_token import UpdateLoginToken
+from .update_message_poll_vote import UpdateMessagePollVote
+from .update_dialog_filter import UpdateDialogFilter
+from .update_dialog_filter_order import UpdateDialogFilterOrder
+from .update_dialog_filters import UpdateDialogFilters
+from .update_phone_call_signaling_data import UpdatePhoneCallSignalingData
+from .update_channel_message_forwards import UpdateChannelMessageForwards
+from .update_read_channel_discussion_inbox import UpdateReadChannelDiscussionInbox
+from .update_read_channel_discussion_outbox import UpdateReadChannelDiscussionOutbox
+from .update_peer_blocked import UpdatePeerBlocked
+from .update_channel_user_typing import UpdateChannelUserTyping
+from .update_pinned_messages import UpdatePinnedMessages
+from .update_pinned_channel_messages import UpdatePinnedChannelMessages
+from .update_chat import UpdateChat
+from .update_group_call_participants import UpdateGroupCallParticipants
+from .update_group_call import UpdateGroupCall
+from .update_peer_history_ttl import UpdatePeerHistoryTTL
+from .update_chat_participant import UpdateChatParticipant
+from .update_channel_participant import UpdateChannelParticipant
+from .update_bot_stopped import UpdateBotStopped
+from .update_group_call_connection import UpdateGroupCallConnection
+from .update_bot_commands import UpdateBotCommands
+from .update_pending_join_requests import UpdatePendingJoinRequests
+from .update_bot_chat_invite_requester import UpdateBotChatInviteRequester
+from .update_message_reactions import UpdateMessageReactions
+from .update_attach_menu_bots import UpdateAttachMenuBots
+from .update_web_view_result_sent import UpdateWebViewResultSent
+from .update_bot_menu_button import UpdateBotMenuButton
+from .update_saved_ringtones import UpdateSavedRingtones
+from .updates_too_long import UpdatesTooLong
+from .update_short_message import UpdateShortMessage
+from .update_short_chat_message import UpdateShortChatMessage
+from .update_short import UpdateShort
+from .updates_combined import UpdatesCombined
+from .updates_t import Updates
+from .update_short_sent_message import UpdateShortSentMessage
+from .dc_option import DcOption
+from .config import Config
+from .nearest_dc import NearestDc
+from .encrypted_chat_empty import EncryptedChatEmpty
+from .encrypted_chat_waiting import EncryptedChatWaiting
+from .encrypted_chat_requested import EncryptedChatRequested
+from .encrypted_chat import EncryptedChat
+from .encrypted_chat_discarded import EncryptedChatDiscarded
+from .input_encrypted_chat import InputEncryptedChat
+from .encrypted_file_empty import EncryptedFileEmpty
+from .encrypted_file import EncryptedFile
+from .input_encrypted_file_empty import InputEncryptedFileEmpty
+from .input_encrypted_file_uploaded import InputEncryptedFileUploaded
+from .input_encrypted_file import InputEncryptedFile
+from .input_encrypted_file_big_uploaded import InputEncryptedFileBigUploaded
+from .encrypted_message import EncryptedMessage
+from .encrypted_message_service import EncryptedMessageService
+from .input_document_empty import InputDocumentEmpty
+from .input_document import InputDocument
+from .document_empty import DocumentEmpty
+from .document import Document
+from .notify_peer import NotifyPeer
+from .notify_users import NotifyUsers
+from .notify_chats import NotifyChats
+from .notify_broadcasts import NotifyBroadcasts
+from .send_message_typing_action import SendMessageTypingAction
+from .send_message_cancel_action import SendMessageCancelAction
+from .send_message_record_video_action import SendMessageRecordVideoAction
+from .send_message_upload_video_action import SendMessageUploadVideoAction
+from .send_message_record_audio_action import SendMessageRecordAudioAction
+from .send_message_upload_audio_action import SendMessageUploadAudioAction
+from .send_message_upload_photo_action import SendMessageUploadPhotoAction
+from .send_message_upload_document_action import SendMessageUploadDocumentAction
+from .send_message_geo_location_action import SendMessageGeoLocationAction
+from .send_message_choose_contact_action import SendMessageChooseContactAction
+from .send_message_game_play_action import SendMessageGamePlayAction
+from .send_message_record_round_action import SendMessageRecordRoundAction
+from .send_message_upload_round_action import SendMessageUploadRoundAction
+from .speaking_in_group_call_action import SpeakingInGroupCallAction
+from .send_message_history_import_action import SendMessageHistoryImportAction
+from .send_message_choose_sticker_action import SendMessageChooseStickerAction
+from .send_message_emoji_interaction import SendMessageEmojiInteraction
+from .send_message_emoji_interaction_seen import SendMessageEmojiInteractionSeen
+from .input_privacy_key_status_timestamp import InputPrivacyKeyStatusTimestamp
+from .input_privacy_key_chat_invite import InputPrivacyKeyChatInvite
+from .input_privacy_key_phone_call import InputPrivacyKeyPhoneCall
+from .input_privacy_key_phone_p2_p import InputPrivacyKeyPhoneP2P
+from .input_privacy_key_forwards import InputPrivacyKeyForwards
+from .input_privacy_key_profile_photo import InputPrivacyKeyProfilePhoto
+from .input_privacy_key_phone_number import InputPrivacyKeyPhoneNumber
+from .input_privacy_key_added_by_phone import InputPrivacyKeyAddedByPhone
+from .privacy_key_status_timestamp import PrivacyKeyStatusTimestamp
+from .privacy_key_chat_invite import PrivacyKeyChatInvite
+from .privacy_key_phone_call import PrivacyKeyPhoneCall
+from .privacy_key_phone_p2_p import PrivacyKeyPhoneP2P
+from .privacy_key_forwards import PrivacyKeyForwards
+from .privacy_key_profile_photo import PrivacyKeyProfilePhoto
+from .privacy_key_phone_number import PrivacyKeyPhoneNumber
+from .privacy_key_added_by_phone import PrivacyKeyAddedByPhone
+from .input_privacy_value_allow_contacts import InputPrivacyValueAllowContacts
+from .input_privacy_value_allow_all import InputPrivacyValueAllowAll
+from .input_privacy_value_allow_users import InputPrivacyValueAllowUsers
+from .input_privacy_value_disallow_contacts import InputPrivacyValueDisallowContacts
+from .input_privacy_value_disallow_all import InputPrivacyValueDisallowAll
+from .input_privacy_value_disallow_users import InputPrivacyValueDisallowUsers
+from .input_privacy_value_allow_chat_participants import InputPrivacyValueAllowChatParticipants
+from .input_privacy_value_disallow_chat_participants import InputPrivacyValueDisallowChatParticipants
+from .privacy_value_allow_contacts import PrivacyValueAllowContacts
+from .privacy_value_allow_all import PrivacyValueAllowAll
+from .privacy_value_allow_users import PrivacyValueAllowUsers
+from .privacy_value_disallow_contacts import PrivacyValueDisallowContacts
+from .privacy_value_disallow_all import PrivacyValueDisallowAll
+from .privacy_value_disallow_users import PrivacyValueDisallowUsers
+from .privacy_value_allow_chat_participants import PrivacyValueAllowChatParticipants
+from .privacy_value_disallow_chat_participants import PrivacyValueDisallowChatParticipants
+from .account_days_ttl import AccountDaysTTL
+from .document_attribute_image_size import DocumentAttributeImageSize
+from .document_attribute_animated import DocumentAttributeAnimated
+from .document_attribute_sticker import DocumentAttributeSticker
+from .document_attribute_video import DocumentAttributeVideo
+from .document_attribute_audio import DocumentAttributeAudio
+from .document_attribute_filename import DocumentAttributeFilename
+from .document_attribute_has_stickers import DocumentAttributeHasStickers
+from .sticker_pack import StickerPack
+from .web_page_empty import WebPageEmpty
+from .web_page_pending import WebPagePending
+from .web_page import WebPage
+from .web_page_not_modified import WebPageNotModified
+from .authorization import Authorization
+from .received_notify_message import ReceivedNotifyMessage
+from .chat_invite_exported import ChatInviteExported
+from .chat_invite_already import ChatInviteAlready
+from .chat_invite import ChatInvite
+from .chat_invite_peek import ChatInvitePeek
+from .input_sticker_set_empty import InputStickerSetEmpty
+from .input_sticker_set_id import InputStickerSetID
+from .input_sticker_set_short_name import InputStickerSetShortName
+from .input_sticker_set_animated_emoji import InputStickerSetAnimatedEmoji
+from .input_sticker_set_dice import InputStickerSetDice
+from .input_sticker_set_animated_emoji_animations import InputStickerSetAnimatedEmojiAnimations
+from .sticker_set import StickerSet
+from .bot_command import BotCommand
+from .bot_info import BotInfo
+from .keyboard_button import KeyboardButton
+from .keyboard_button_url import KeyboardButtonUrl
+from .keyboard_button_callback import KeyboardButtonCallback
+from .keyboard_button_request_phone import KeyboardButtonRequestPhone
+from .keyboard_button_request_geo_location import KeyboardButtonRequestGeoLocation
+from .keyboard_button_switch_inline import KeyboardButtonSwitchInline
+from .keyboard_button_game import KeyboardButtonGame
+from .keyboard_button_buy import KeyboardButtonBuy
+from .keyboard_button_url_auth import KeyboardButtonUrlAuth
+from .input_keyboard_button_url_auth import InputKeyboardButtonUrlAuth
+from .keyboard_button_request_poll import KeyboardButtonRequestPoll
+from .input_keyboard_button_user_profile import InputKeyboardButtonUserProfile
+from .keyboard_button_user_profile import KeyboardButtonUserProfile
+from .keyboard_button_web_view import KeyboardButtonWebView
+from .keyboard_button_simple_web_view import KeyboardButtonSimpleWebView
+from .keyboard_button_row import KeyboardButtonRow
+from .reply_keyboard_hide import ReplyKeyboardHide
+from .reply_keyboard_force_reply import ReplyKeyboardForceReply
+from .reply_keyboard_markup import ReplyKeyboardMarkup
+from .reply_inline_markup import ReplyInlineMarkup
+from .message_entity_unknown import MessageEntityUnknown
+from .message_entity_mention import MessageEntityMention
+from .message_entity_hashtag import MessageEntityHashtag
+from .message_entity_bot_command import MessageEntityBotCommand
+from .message_entity_url import MessageEntityUrl
+from .message_entity_email import MessageEntityEmail
+from .message_entity_bold import MessageEntityBold
+from .message_entity_italic import MessageEntityItalic
+from .message_entity_code import MessageEntityCode
+from .message_entity_pre import MessageEntityPre
+from .message_entity_text_url import MessageEntityTextUrl
+from .message_entity_mention_name import MessageEntityMentionName
+from .input_message_entity_mention_name import InputMessageEntityMentionName
+from .message_entity_phone import MessageEntityPhone
+from .message_entity_cashtag import MessageEntityCashtag
+from .message_entity_underline import MessageEntityUnderline
+from .message_entity_strike import MessageEntityStrike
+from .message_entity_blockquote import MessageEntityBlockquote
+from .message_entity_bank_card import MessageEntityBankCard
+from .message_entity_spoiler import MessageEntitySpoiler
+from .input_channel_empty import InputChannelEmpty
+from .input_channel import InputChannel
+from .input_channel_from_message import InputChannelFromMessage
+from .message_range import MessageRange
+from .channel_messages_filter_empty import ChannelMessagesFilterEmpty
+from .channel_messages_filter import ChannelMessagesFilter
+from .channel_participant import ChannelParticipant
+from .channel_participant_self import ChannelParticipantSelf
+from .channel_participant_creator import ChannelParticipantCreator
+from .channel_participant_admin import ChannelParticipantAdmin
+from .channel_participant_banned import ChannelParticipantBanned
+from .channel_participant_left import ChannelParticipantLeft
+from .channel_participants_recent import ChannelParticipantsRecent
+from .channel_participants_admins import ChannelParticipantsAdmins
+from .channel_participants_kicked import ChannelParticipantsKicked
+from .channel_participants_bots import ChannelParticipantsBots
+from .channel_participants_banned import ChannelParticipantsBanned
+from .channel_participants_search import ChannelParticipantsSearch
+from .channel_participants_contacts import ChannelParticipantsContacts
+from .channel_participants_mentions import ChannelParticipantsMentions
+from .input_bot_inline_message_media_auto import InputBotInlineMessageMediaAuto
+from .input_bot_inline_message_text import InputBotInlineMessageText
+from .input_bot_inline_message_media_geo import InputBotInlineMessageMediaGeo
+from .input_bot_inline_message_media_venue import InputBotInlineMessageMediaVenue
+from .input_bot_inline_message_media_contact import InputBotInlineMessageMediaContact
+from .input_bot_inline_message_game import InputBotInlineMessageGame
+from .input_bot_inline_message_media_invoice import InputBotInlineMessageMediaInvoice
+from .input_bot_inline_result import InputBotInlineResult
+from .input_bot_inline_result_photo import InputBotInlineResultPhoto
+from .input_bot_inline_result_document import InputBotInlineResultDocument
+from .input_bot_inline_result_game import InputBotInlineResultGame
+from .bot_inline_message_media_auto import BotInlineMessageMediaAuto
+from .bot_inline_message_text import BotInlineMessageText
+from .bot_inline_message_media_geo import BotInlineMessageMediaGeo
+from .bot_inline_message_media_venue import BotInlineMessageMediaVenue
+from .bot_inline_message_media_contact import BotInlineMessageMediaContact
+from .bot_inline_message_media_invoice import BotInlineMessageMediaInvoice
+from .bot_inline_result import BotInlineResult
+from .bot_inline_media_result import BotInlineMediaResult
+from .exported_message_link import ExportedMessageLink
+from .message_fwd_header import MessageFwdHeader
+from .input_bot_inline_message_id import InputBotInlineMessageID
+from .input_bot_inline_message_id64 import InputBotInlineMessageID64
+from .inline_bot_switch_pm import InlineBotSwitchPM
+from .top_peer import TopPeer
+from .top_peer_category_bots_pm import TopPeerCategoryBotsPM
+from .top_peer_category_bots_inline import TopPeerCategoryBotsInline
+from .top_peer_category_correspondents import TopPeerCategoryCorrespondents
+from .top_peer_category_groups import TopPeerCategoryGroups
+from .top_peer_category_channels import TopPeerCategoryChannels
+from .top_peer_category_phone_calls import TopPeerCategoryPhoneCalls
+from .top_peer_category_forward_users import TopPeerCategoryForwardUsers
+from .top_peer_category_forward_chats import TopPeerCategoryForwardChats
+from .top_peer_category_peers import TopPeerCategoryPeers
+from .draft_message_empty import DraftMessageEmpty
+from .draft_message import DraftMessage
+from .sticker_set_covered import StickerSetCovered
+from .sticker_set_multi_covered import StickerSetMultiCovered
+from .mask_coords import MaskCoords
+from .input_stickered_media_photo import InputStickeredMediaPhoto
+from .input_stickered_media_document import InputStickeredMediaDocument
+from .game import Game
+from .input_game_id import InputGameID
+from .input_game_short_name import InputGameShortName
+from .high_score import HighScore
+from .text_empty import TextEmpty
+from .text_plain import TextPlain
+from .text_bold import TextBold
+from .text_italic import TextItalic
+from .text_underline import TextUnderline
+from .text_strike import TextStrike
+from .text_fixed import TextFixed
+from .text_url import TextUrl
+from .text_email import TextEmail
+from .text_concat import TextConcat
+from .text_subscript import TextSubscript
+from .text_superscript import TextSuperscript
+from .text_marked import TextMarked
+from .text_phone import TextPhone
+from .text_image import TextImage
+from .text_anchor import TextAnchor
+from .page_block_unsupported import PageBlockUnsupported
+from .page_block_title import PageBlockTitle
+from .page_block_subtitle import PageBlockSubtitle
+from .page_block_author_date import PageBlockAuthorDate
+from .page_block_header import PageBlockHeader
+from .page_block_subheader import PageBlockSubheader
+from .page_block_paragraph import PageBlockParagraph
+from .page_block_preformatted import PageBlockPreformatted
+from .page_block_footer import PageBlockFooter
+from .page_block_divider import PageBlockDivider
+from .page_block_anchor import PageBlockAnchor
+from .page_block_list import PageBlockList
+from .page_block_blockquote import PageBlockBlockquote
+from .page_block_pullquote import PageBlockPullquote
+from .page_block_photo import PageBlockPhoto
+from .page_block_video import PageBlockVideo
+from .page_block_cover import PageBlockCover
+from .page_block_embed import PageBlockEmbed
+from .page_block_embed_post import PageBlockEmbedPost
+from .page_block_collage import PageBlockCollage
+from .page_block_slideshow import PageBlockSlideshow
+from .page_block_channel import PageBlockChannel
+from .page_block_audio import PageBlockAudio
+from .page_block_kicker import PageBlockKicker
+from .page_block_table import PageBlockTable
+from .page_block_ordered_list import PageBlockOrderedList
+from .page_block_details import PageBlockDetails
+from .page_block_related_articles import PageBlockRelatedArticles
+from .page_block_map import PageBlockMap
+from .phone_call_discard_reason_missed import PhoneCallDiscardReasonMissed
+from .phone_call_discard_reason_disconnect import PhoneCallDiscardReasonDisconnect
+from .phone_call_discard_reason_hangup import PhoneCallDiscardReasonHangup
+from .phone_call_discard_reason_busy import PhoneCallDiscardReasonBusy
+from .data_json import DataJSON
+from .labeled_price import LabeledPrice
+from .invoice import Invoice
+from .payment_charge import PaymentCharge
+from .post_address import PostAddress
+from .payment_requested_info import PaymentRequestedInfo
+from .payment_saved_credentials_card import PaymentSavedCredentialsCard
+from .web_document import WebDocument
+from .web_document_no_proxy import WebDocumentNoProxy
+from .input_web_document import InputWebDocument
+from .input_web_file_location import InputWebFileLocation
+from .input_web_file_geo_point_location import InputWebFileGeoPointLocation
+from .input_payment_credentials_saved import InputPaymentCredentialsSaved
+from .input_payment_credentials import InputPaymentCredentials
+from .input_payment_credentials_apple_pay import InputPaymentCredentialsApplePay
+from .input_payment_credentials_google_pay import InputPaymentCredentialsGooglePay
+from .shipping_option import ShippingOption
+from .input_sticker_set_item import InputStickerSetItem
+from .input_phone_call import InputPhoneCall
+from .phone_call_empty import PhoneCallEmpty
+from .phone_call_waiting import PhoneCallWaiting
+from .phone_call_requested import PhoneCallRequested
+from .phone_call_accepted import PhoneCallAccepted
+from .phone_call import PhoneCall
+from .phone_call_discarded import PhoneCallDiscarded
+from .phone_connection import PhoneConnection
+from .phone_connection_webrtc import PhoneConnectionWebrtc
+from .phone_call_protocol import PhoneCallProtocol
+from .cdn_public_key import CdnPublicKey
+from .cdn_config import CdnConfig
+from .lang_pack_string import LangPackString
+from .lang_pack_string_pluralized import LangPackStringPluralized
+from .lang_pack_string_deleted import LangPackStringDeleted
+from .lang_pack_difference import LangPackDifference
+from .lang_pack_language import LangPackLanguage
+from .channel_admin_log_event_action_change_title import ChannelAdminLogEventActionChangeTitle
+from .channel_admin_log_event_action_change_about import ChannelAdminLogEventActionChangeAbout
+from .channel_admin_log_event_action_change_username import ChannelAdminLogEventActionChangeUsername
+from .channel_admin_log_event_action_change_photo import ChannelAdminLogEventActionChangePhoto
+from .channel_admin_log_event_action_toggle_invites import ChannelAdminLogEventActionToggleInvites
+from .channel_admin_log_event_action_toggle_signatures import ChannelAdminLogEventActionToggleSignatures
+from .channel_admin_log_event_action_update_pinned import ChannelAdminLogEventActionUpdatePinned
+from .channel_admin_log_event_action_edit_message import ChannelAdminLogEventActionEditMessage
+from .channel_admin_log_event_action_delete_message import ChannelAdminLogEventActionDeleteMessage
+from .channel_admin_log_event_action_participant_join import ChannelAdminLogEventActionParticipantJoin
+from .channel_admin_log_event_action_participant_leave import ChannelAdminLogEventActionParticipantLeave
+from .channel_admin_log_event_action_participant_invite import ChannelAdminLogEventActionParticipantInvite
+from .channel_admin_log_event_action_participant_toggle_ban import ChannelAdminLogEventActionParticipantToggleBan
+from .channel_admin_log_event_action_participant_toggle_admin import ChannelAdminLogEventActionParticipantToggleAdmin
+from .channel_admin_log_event_action_change_sticker_set import ChannelAdminLogEventActionChangeStickerSet
+from .channel_admin_log_event_action_toggle_pre_history_hidden import ChannelAdminLogEventActionTogglePreHistoryHidden
+from .channel_admin_log_event_action_default_banned_rights import ChannelAdminLogEventActionDefaultBannedRights
+from .channel_admin_log_event_action_stop_poll import ChannelAdminLogEventActionStopPoll
+from .channel_admin_log_event_action_change_linked_chat import ChannelAdminLogEventActionChangeLinkedChat
+from .channel_admin_log_event_action_change_location import ChannelAdminLogEventActionChangeLocation
+from .channel_admin_log_event_action_toggle_slow_mode import ChannelAdminLogEventActionToggleSlowMode
+from .channel_admin_log_event_action_start_group_call import ChannelAdminLogEventActionStartGroupCall
+from .channel_admin_log_event_action_discard_group_call import ChannelAdminLogEventActionDiscardGroupCall
+from .channel_admin_log_event_action_participant_mute import ChannelAdminLogEventActionParticipantMute
+from .channel_admin_log_event_action_participant_unmute import ChannelAdminLogEventActionParticipantUnmute
+from .channel_admin_log_event_action_toggle_group_call_setting import ChannelAdminLogEventActionToggleGroupCallSetting
+from .channel_admin_log_event_action_participant_join_by_invite import ChannelAdminLogEventActionParticipantJoinByInvite
+from .channel_admin_log_event_action_exported_invite_delete import ChannelAdminLogEventActionExportedInviteDelete
+from .channel_admin_log_event_action_exported_invite_revoke import ChannelAdminLogEventActionExportedInviteRevoke
+from .channel_admin_log_event_action_exported_invite_edit import ChannelAdminLogEventActionExportedInviteEdit
+from .channel_admin_log_event_action_participant_volume import ChannelAdminLogEventActionParticipantVolume
+from .channel_admin_log_event_action_change_history_ttl import ChannelAdminLogEventActionChangeHistoryTTL
+from .channel_admin_log_event_action_participant_join_by_request import ChannelAdminLogEventActionParticipantJoinByRequest
+from .channel_admin_log_event_action_toggle_no_forwards import ChannelAdminLogEventActionToggleNoForwards
+from .channel_admin_log_event_action_send_message import ChannelAdminLogEventActionSendMessage
+from .channel_admin_log_event_action_change_available_reactions import ChannelAdminLogEventActionChangeAvailableReactions
+from .channel_admin_log_event import ChannelAdminLogEvent
+from .channel_admin_log_events_filter import ChannelAdminLogEventsFilter
+from .popular_contact import PopularContact
+from .recent_me_url_unknown import RecentMeUrlUnknown
+from .recent_me_url_user import RecentMeUrlUser
+from .recent_me_url_chat import RecentMeUrlChat
+from .recent_me_url_chat_invite import RecentMeUrlChatInvite
+from .recent_me_url_sticker_set import RecentMeUrlStickerSet
+from .input_single_media import InputSingleMedia
+from .web_authorization import WebAuthorization
+from .input_message_id import InputMessageID
+from .input_message_reply_to import InputMessageReplyTo
+from .input_message_pinned import InputMessagePinned
+from .input_message_callback_query import InputMessageCallbackQuery
+from .input_dialog_peer import InputDialogPeer
+from .input_dialog_peer_folder import InputDialogPeerFolder
+from .dialog_peer import DialogPeer
+from .dialog_peer_folder import DialogPeerFolder
+from .file_hash import FileHash
+from .input_client_proxy import InputClientProxy
+from .input_secure_file_uploaded import InputSecureFileUploaded
+from .input_secure_file import InputSecureFile
+from .secure_file_empty import SecureFileEmpty
+from .secure_file import SecureFile
+from .secure_data import SecureData
+from .secure_plain_phone import SecurePlainPhone
+from .secure_plain_email import SecurePlainEmail
+from .secure_value_type_personal_details import SecureValueTypePersonalDetails
+from .secure_value_type_passport import SecureValueTypePassport
+from .secure_value_type_driver_license import SecureValueTypeDriverLicense
+from .secure_value_type_identity_card import SecureValueTypeIdentityCard
+from .secure_value_type_internal_passport import SecureValueTypeInternalPassport
+from .secure_value_type_address import SecureValueTypeAddress
+from .secure_value_type_utility_bill import SecureValueTypeUtilityBill
+from .secure_value_type_bank_statement import SecureValueTypeBankStatement
+from .secure_value_type_rental_agreement import SecureValueTypeRentalAgreement
+from .secure_value_type_passport_registration import SecureValueTypePassportRegistration
+from .secure_value_type_temporary_registration import SecureValueTypeTemporaryRegistration
+from .secure_value_type_phone import SecureValueTypePhone
+from .secure_value_type_email import SecureValueTypeEmail
+from .secure_value import SecureValue
+from .input_secure_value import InputSecureValue
+from .secure_value_hash import SecureValueHash
+from .secure_value_error_data import SecureValueErrorData
+from .secure_value_error_front_side import SecureValueErrorFrontSide
+from .secure_value_error_reverse_side import SecureValueErrorReverseSide
+from .secure_value_error_selfie import SecureValueErrorSelfie
+from .secure_value_error_file import SecureValueErrorFile
+from .secure_value_error_files import SecureValueErrorFiles
+from .secure_value_error import SecureValueError
+from .secure_value_error_translation_file import SecureValueErrorTranslationFile
+from .secure_value_error_translation_files import SecureValueErrorTranslationFiles
+from .secure_credentials_encrypted import SecureCredentialsEncrypted
+from .saved_phone_contact import SavedPhoneContact
+from .password_kdf_algo_unknown import PasswordKdfAlgoUnknown
+from .password_kdf_algo_sha256_sha256_pbkdf2_hmacsha512iter100000_sha256_mod_pow import PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow
+from .secure_password_kdf_algo_unknown import SecurePasswordKdfAlgoUnknown
+from .secure_password_kdf_algo_pbkdf2_hmacsha512iter100000 import SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000
+from .secure_password_kdf_algo_sha512 import SecurePasswordKdfAlgoSHA512
+from .secure_secret_settings import SecureSecretSettings
+from .input_check_password_empty import InputCheckPasswordEmpty
+from .input_check_password_srp import InputCheckPasswordSRP
+from .secure_required_type import SecureRequiredType
+from .secure_required_type_one_of import SecureRequiredTypeOneOf
+from .input_app_event import InputAppEvent
+from .json_object_value import JsonObjectValue
+from .json_null import JsonNull
+from .json_bool import JsonBool
+from .json_number import JsonNumber
+from .json_string import JsonString
+from .json_array import JsonArray
+from .json_object import JsonObject
+from .page_table_cell import PageTableCell
+from .page_table_row import PageTableRow
+from .page_caption import PageCaption
+from .page_list_item_text import PageListItemText
+from .page_list_item_blocks import PageListItemBlocks
+from .page_list_ordered_item_text import PageListOrderedItemText
+from .page_list_ordered_item_blocks import PageListOrderedItemBlocks
+from .page_related_article import PageRelatedArticle
+from .page import Page
+from .poll_answer import PollAnswer
+from .poll import Poll
+from .poll_answer_voters import PollAnswerVoters
+from .poll_results import PollResults
+from .chat_onlines import ChatOnlines
+from .stats_url import StatsURL
+from .chat_admin_rights import ChatAdminRights
+from .chat_banned_rights import ChatBannedRights
+from .input_wall_paper import InputWallPaper
+from .input_wall_paper_slug import InputWallPaperSlug
+from .input_wall_paper_no_file import InputWallPaperNoFile
+from .code_settings import CodeSettings
+from .wall_paper_settings import WallPaperSettings
+from .auto_download_settings import AutoDownloadSettings
+from .emoji_keyword import EmojiKeyword
+from .emoji_keyword_deleted import EmojiKeywordDeleted
+from .emoji_keywords_difference import EmojiKeywordsDifference
+from .emoji_url import EmojiURL
+from .emoji_language import EmojiLanguage
+from .folder import Folder
+from .input_folder_peer import InputFolderPeer
+from .folder_peer import FolderPeer
+from .url_auth_result_request import UrlAuthResultRequest
+from .url_auth_result_accepted import UrlAuthResultAccepted
+from .url_auth_result_default import UrlAuthResultDefault
+from .channel_location_empty import ChannelLocationEmpty
+from .channel_location import ChannelLocation
+from .peer_located import PeerLocated
+from .peer_self_located import PeerSelfLocated
+from .restriction_reason import RestrictionReason
+from .input_theme import InputTheme
+from .input_theme_slug import InputThemeSlug
+from .theme import Theme
+from .base_theme_classic import BaseThemeClassic
+from .base_theme_day import BaseThemeDay
+from .base_theme_night import BaseThemeNight
+from .base_theme_tinted import BaseThemeTinted
+from .base_theme_arctic import BaseThemeArctic
+from .input_theme_settings import InputThemeSettings
+from .theme_settings import ThemeSettings
+from .web_page_attribute_theme import WebPageAttributeTheme
+from .message_user_vote import MessageUserVote
+from .message_user_vote_input_option import MessageUserVoteInputOption
+from .message_user_vote_multiple import MessageUserVoteMultiple
+from .bank_card_open_url import BankCardOpenUrl
+from .dialog_filter import DialogFilter
+from .dialog_filter_suggested import DialogFilterSuggested
+from .stats_date_range_days import StatsDateRangeDays
+from .stats_abs_value_and_prev import StatsAbsValueAndPrev
+from .stats_percent_value import StatsPercentValue
+from .stats_graph_async import StatsGraphAsync
+from .stats_graph_error import StatsGraphError
+from .stats_graph import StatsGraph
+from .message_interaction_counters import MessageInteractionCounters
+from .video_size import VideoSize
+from .stats_group_top_poster import StatsGroupTopPoster
+from .stats_group_top_admin import StatsGroupTopAdmin
+from .stats_group_top_inviter import StatsGroupTopInviter
+from .global_privacy_settings import GlobalPrivacySettings
+from .message_views import MessageViews
+from .message_reply_header import MessageReplyHeader
+from .message_replies import MessageReplies
+from .peer_blocked import PeerBlocked
+from .group_call_discarded import GroupCallDiscarded
+from .group_call import GroupCall
+from .input_group_call import InputGroupCall
+from .group_call_participant import GroupCallParticipant
+from .inline_query_peer_type_same_bot_pm import InlineQueryPeerTypeSameBotPM
+from .inline_query_peer_type_pm import InlineQueryPeerTypePM
+from .inline_query_peer_type_chat import InlineQueryPeerTypeChat
+from .inline_query_peer_type_megagroup import InlineQueryPeerTypeMegagroup
+from .inline_query_peer_type_broadcast import InlineQueryPeerTypeBroadcast
+from .chat_invite_importer import ChatInviteImporter
+from .chat_admin_with_invites import ChatAdminWithInvites
+from .group_call_participant_video_source_group import GroupCallParticipantVideoSourceGroup
+from .group_call_participant_video import GroupCallParticipantVideo
+from .bot_command_scope_default import BotCommandScopeDefault
+from .bot_command_scope_users import BotCommandScopeUsers
+from .bot_command_scope_chats import BotCommandScopeChats
+from .bot_command_scope_chat_admins import BotCommandScopeChatAdmins
+from .bot_command_scope_peer import BotCommandScopePeer
+from .bot_command_scope_peer_admins import BotCommandScopePeerAdmins
+from .bot_command_scope_peer_user import BotCommandScopePeerUser
+from .sponsored_message import SponsoredMessage
+from .search_results_calendar_period import SearchResultsCalendarPeriod
+from .search_result_position import SearchResultPosition
+from .reaction_count import ReactionCount
+from .message_reactions import MessageReactions
+from .available_reaction import AvailableReaction
+from .message_peer_reaction import MessagePeerReaction
+from .group_call_stream_channel import GroupCallStreamChannel
+from .attach_menu_bot_icon_color import AttachMenuBotIconColor
+from .attach_menu_bot_icon import AttachMenuBotIcon
+from .attach_menu_bot import AttachMenuBot
+from .attach_menu_bots_not_modified import AttachMenuBotsNotModified
+from .attach_menu_bots import AttachMenuBots
+from .attach_menu_bots_bot import AttachMenuBotsBot
+from .web_view_result_url import WebViewResultUrl
+from .simple_web_view_result_url import SimpleWebViewResultUrl
+from .web_view_message_sent import WebViewMessageSent
+from .bot_menu_button_default import BotMenuButtonDefault
+from .bot_menu_button_commands import BotMenuButtonCommands
+from .bot_menu_button import BotMenuButton
+from .notification_sound_default import NotificationSoundDefault
+from .notification_sound_none import NotificationSoundNone
+from .notification_sound_local import NotificationSoundLocal
+from .notification_sound_ringtone import NotificationSoundRingtone
+from . import help, storage, auth, contacts, messages, updates, photos, upload, account, channels, payments, phone, stats, stickers, users
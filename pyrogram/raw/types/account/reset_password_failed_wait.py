@@ -0,0 +1,76 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ResetPasswordFailedWait(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.account.ResetPasswordResult`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``E3779861``
+
+    Parameters:
+        retry_date: ``int`` ``32-bit``
+
+    See Also:
+        This object can be returned by 1 method:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`account.ResetPassword <pyrogram.raw.functions.account.ResetPassword>`
+    """
+
+    __slots__: List[str] = ["retry_date"]
+
+    ID = 0xe3779861
+    QUALNAME = "types.account.ResetPasswordFailedWait"
+
+    def __init__(self, *, retry_date: int) -> None:
+        self.retry_date = retry_date  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ResetPasswordFailedWait":
+        # No flags
+        
+        retry_date = Int.read(b)
+        
+        return ResetPasswordFailedWait(retry_date=retry_date)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.retry_date))
+        
+        return b.getvalue()
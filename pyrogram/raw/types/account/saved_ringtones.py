@@ -0,0 +1,82 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SavedRingtones(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.account.SavedRingtones`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``C1E92CC5``
+
+    Parameters:
+        hash: ``int`` ``64-bit``
+        ringtones: List of :obj:`Document <pyrogram.raw.base.Document>`
+
+    See Also:
+        This object can be returned by 1 method:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`account.GetSavedRingtones <pyrogram.raw.functions.account.GetSavedRingtones>`
+    """
+
+    __slots__: List[str] = ["hash", "ringtones"]
+
+    ID = 0xc1e92cc5
+    QUALNAME = "types.account.SavedRingtones"
+
+    def __init__(self, *, hash: int, ringtones: List["raw.base.Document"]) -> None:
+        self.hash = hash  # long
+        self.ringtones = ringtones  # Vector<Document>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SavedRingtones":
+        # No flags
+        
+        hash = Long.read(b)
+        
+        ringtones = TLObject.read(b)
+        
+        return SavedRingtones(hash=hash, ringtones=ringtones)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.hash))
+        
+        b.write(Vector(self.ringtones))
+        
+        return b.getvalue()
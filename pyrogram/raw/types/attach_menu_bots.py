@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class AttachMenuBots(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.AttachMenuBots`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``3C4301C0``
+
+    Parameters:
+        hash: ``int`` ``64-bit``
+        bots: List of :obj:`AttachMenuBot <pyrogram.raw.base.AttachMenuBot>`
+        users: List of :obj:`User <pyrogram.raw.base.User>`
+
+    See Also:
+        This object can be returned by 1 method:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`messages.GetAttachMenuBots <pyrogram.raw.functions.messages.GetAttachMenuBots>`
+    """
+
+    __slots__: List[str] = ["hash", "bots", "users"]
+
+    ID = 0x3c4301c0
+    QUALNAME = "types.AttachMenuBots"
+
+    def __init__(self, *, hash: int, bots: List["raw.base.AttachMenuBot"], users: List["raw.base.User"]) -> None:
+        self.hash = hash  # long
+        self.bots = bots  # Vector<AttachMenuBot>
+        self.users = users  # Vector<User>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "AttachMenuBots":
+        # No flags
+        
+        hash = Long.read(b)
+        
+        bots = TLObject.read(b)
+        
+        users = TLObject.read(b)
+        
+        return AttachMenuBots(hash=hash, bots=bots, users=users)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.hash))
+        
+        b.write(Vector(self.bots))
+        
+        b.write(Vector(self.users))
+        
+        return b.getvalue()
@@ -0,0 +1,42 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .sent_code import SentCode
+from .authorization import Authorization
+from .authorization_sign_up_required import AuthorizationSignUpRequired
+from .exported_authorization import ExportedAuthorization
+from .password_recovery import PasswordRecovery
+from .code_type_sms import CodeTypeSms
+from .code_type_call import CodeTypeCall
+from .code_type_flash_call import CodeTypeFlashCall
+from .code_type_missed_call import CodeTypeMissedCall
+from .sent_code_type_app import SentCodeTypeApp
+from .sent_code_type_sms import SentCodeTypeSms
+from .sent_code_type_call import SentCodeTypeCall
+from .sent_code_type_flash_call import SentCodeTypeFlashCall
+from .sent_code_type_missed_call import SentCodeTypeMissedCall
+from .login_token import LoginToken
+from .login_token_migrate_to import LoginTokenMigrateTo
+from .login_token_success import LoginTokenSuccess
+from .logged_out import LoggedOut
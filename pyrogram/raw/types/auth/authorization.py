@@ -0,0 +1,101 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class Authorization(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.auth.Authorization`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``33FB7BB8``
+
+    Parameters:
+        user: :obj:`User <pyrogram.raw.base.User>`
+        setup_password_required (optional): ``bool``
+        otherwise_relogin_days (optional): ``int`` ``32-bit``
+        tmp_sessions (optional): ``int`` ``32-bit``
+
+    See Also:
+        This object can be returned by 6 methods:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`auth.SignUp <pyrogram.raw.functions.auth.SignUp>`
+            - :obj:`auth.SignIn <pyrogram.raw.functions.auth.SignIn>`
+            - :obj:`auth.ImportAuthorization <pyrogram.raw.functions.auth.ImportAuthorization>`
+            - :obj:`auth.ImportBotAuthorization <pyrogram.raw.functions.auth.ImportBotAuthorization>`
+            - :obj:`auth.CheckPassword <pyrogram.raw.functions.auth.CheckPassword>`
+            - :obj:`auth.RecoverPassword <pyrogram.raw.functions.auth.RecoverPassword>`
+    """
+
+    __slots__: List[str] = ["user", "setup_password_required", "otherwise_relogin_days", "tmp_sessions"]
+
+    ID = 0x33fb7bb8
+    QUALNAME = "types.auth.Authorization"
+
+    def __init__(self, *, user: "raw.base.User", setup_password_required: Optional[bool] = None, otherwise_relogin_days: Optional[int] = None, tmp_sessions: Optional[int] = None) -> None:
+        self.user = user  # User
+        self.setup_password_required = setup_password_required  # flags.1?true
+        self.otherwise_relogin_days = otherwise_relogin_days  # flags.1?int
+        self.tmp_sessions = tmp_sessions  # flags.0?int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "Authorization":
+        
+        flags = Int.read(b)
+        
+        setup_password_required = True if flags & (1 << 1) else False
+        otherwise_relogin_days = Int.read(b) if flags & (1 << 1) else None
+        tmp_sessions = Int.read(b) if flags & (1 << 0) else None
+        user = TLObject.read(b)
+        
+        return Authorization(user=user, setup_password_required=setup_password_required, otherwise_relogin_days=otherwise_relogin_days, tmp_sessions=tmp_sessions)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 1) if self.setup_password_required else 0
+        flags |= (1 << 1) if self.otherwise_relogin_days is not None else 0
+        flags |= (1 << 0) if self.tmp_sessions is not None else 0
+        b.write(Int(flags))
+        
+        if self.otherwise_relogin_days is not None:
+            b.write(Int(self.otherwise_relogin_days))
+        
+        if self.tmp_sessions is not None:
+            b.write(Int(self.tmp_sessions))
+        
+        b.write(self.user.write())
+        
+        return b.getvalue()
@@ -0,0 +1,79 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class LoggedOut(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.auth.LoggedOut`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``C3A2835F``
+
+    Parameters:
+        future_auth_token (optional): ``bytes``
+
+    See Also:
+        This object can be returned by 1 method:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`auth.LogOut <pyrogram.raw.functions.auth.LogOut>`
+    """
+
+    __slots__: List[str] = ["future_auth_token"]
+
+    ID = 0xc3a2835f
+    QUALNAME = "types.auth.LoggedOut"
+
+    def __init__(self, *, future_auth_token: Optional[bytes] = None) -> None:
+        self.future_auth_token = future_auth_token  # flags.0?bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "LoggedOut":
+        
+        flags = Int.read(b)
+        
+        future_auth_token = Bytes.read(b) if flags & (1 << 0) else None
+        return LoggedOut(future_auth_token=future_auth_token)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.future_auth_token is not None else 0
+        b.write(Int(flags))
+        
+        if self.future_auth_token is not None:
+            b.write(Bytes(self.future_auth_token))
+        
+        return b.getvalue()
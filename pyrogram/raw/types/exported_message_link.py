@@ -0,0 +1,82 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ExportedMessageLink(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.ExportedMessageLink`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``5DAB1AF4``
+
+    Parameters:
+        link: ``str``
+        html: ``str``
+
+    See Also:
+        This object can be returned by 1 method:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`channels.ExportMessageLink <pyrogram.raw.functions.channels.ExportMessageLink>`
+    """
+
+    __slots__: List[str] = ["link", "html"]
+
+    ID = 0x5dab1af4
+    QUALNAME = "types.ExportedMessageLink"
+
+    def __init__(self, *, link: str, html: str) -> None:
+        self.link = link  # string
+        self.html = html  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ExportedMessageLink":
+        # No flags
+        
+        link = String.read(b)
+        
+        html = String.read(b)
+        
+        return ExportedMessageLink(link=link, html=html)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.link))
+        
+        b.write(String(self.html))
+        
+        return b.getvalue()
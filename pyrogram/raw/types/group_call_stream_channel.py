@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GroupCallStreamChannel(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.GroupCallStreamChannel`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``80EB48AF``
+
+    Parameters:
+        channel: ``int`` ``32-bit``
+        scale: ``int`` ``32-bit``
+        last_timestamp_ms: ``int`` ``64-bit``
+    """
+
+    __slots__: List[str] = ["channel", "scale", "last_timestamp_ms"]
+
+    ID = 0x80eb48af
+    QUALNAME = "types.GroupCallStreamChannel"
+
+    def __init__(self, *, channel: int, scale: int, last_timestamp_ms: int) -> None:
+        self.channel = channel  # int
+        self.scale = scale  # int
+        self.last_timestamp_ms = last_timestamp_ms  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GroupCallStreamChannel":
+        # No flags
+        
+        channel = Int.read(b)
+        
+        scale = Int.read(b)
+        
+        last_timestamp_ms = Long.read(b)
+        
+        return GroupCallStreamChannel(channel=channel, scale=scale, last_timestamp_ms=last_timestamp_ms)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.channel))
+        
+        b.write(Int(self.scale))
+        
+        b.write(Long(self.last_timestamp_ms))
+        
+        return b.getvalue()
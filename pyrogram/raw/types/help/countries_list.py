@@ -0,0 +1,82 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class CountriesList(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.help.CountriesList`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``87D0759E``
+
+    Parameters:
+        countries: List of :obj:`help.Country <pyrogram.raw.base.help.Country>`
+        hash: ``int`` ``32-bit``
+
+    See Also:
+        This object can be returned by 1 method:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`help.GetCountriesList <pyrogram.raw.functions.help.GetCountriesList>`
+    """
+
+    __slots__: List[str] = ["countries", "hash"]
+
+    ID = 0x87d0759e
+    QUALNAME = "types.help.CountriesList"
+
+    def __init__(self, *, countries: List["raw.base.help.Country"], hash: int) -> None:
+        self.countries = countries  # Vector<help.Country>
+        self.hash = hash  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "CountriesList":
+        # No flags
+        
+        countries = TLObject.read(b)
+        
+        hash = Int.read(b)
+        
+        return CountriesList(countries=countries, hash=hash)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.countries))
+        
+        b.write(Int(self.hash))
+        
+        return b.getvalue()
@@ -0,0 +1,74 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputGameShortName(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.InputGame`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``C331E80A``
+
+    Parameters:
+        bot_id: :obj:`InputUser <pyrogram.raw.base.InputUser>`
+        short_name: ``str``
+    """
+
+    __slots__: List[str] = ["bot_id", "short_name"]
+
+    ID = 0xc331e80a
+    QUALNAME = "types.InputGameShortName"
+
+    def __init__(self, *, bot_id: "raw.base.InputUser", short_name: str) -> None:
+        self.bot_id = bot_id  # InputUser
+        self.short_name = short_name  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputGameShortName":
+        # No flags
+        
+        bot_id = TLObject.read(b)
+        
+        short_name = String.read(b)
+        
+        return InputGameShortName(bot_id=bot_id, short_name=short_name)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.bot_id.write())
+        
+        b.write(String(self.short_name))
+        
+        return b.getvalue()
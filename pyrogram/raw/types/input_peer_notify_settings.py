@@ -0,0 +1,93 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputPeerNotifySettings(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.InputPeerNotifySettings`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``DF1F002B``
+
+    Parameters:
+        show_previews (optional): ``bool``
+        silent (optional): ``bool``
+        mute_until (optional): ``int`` ``32-bit``
+        sound (optional): :obj:`NotificationSound <pyrogram.raw.base.NotificationSound>`
+    """
+
+    __slots__: List[str] = ["show_previews", "silent", "mute_until", "sound"]
+
+    ID = 0xdf1f002b
+    QUALNAME = "types.InputPeerNotifySettings"
+
+    def __init__(self, *, show_previews: Optional[bool] = None, silent: Optional[bool] = None, mute_until: Optional[int] = None, sound: "raw.base.NotificationSound" = None) -> None:
+        self.show_previews = show_previews  # flags.0?Bool
+        self.silent = silent  # flags.1?Bool
+        self.mute_until = mute_until  # flags.2?int
+        self.sound = sound  # flags.3?NotificationSound
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputPeerNotifySettings":
+        
+        flags = Int.read(b)
+        
+        show_previews = Bool.read(b) if flags & (1 << 0) else None
+        silent = Bool.read(b) if flags & (1 << 1) else None
+        mute_until = Int.read(b) if flags & (1 << 2) else None
+        sound = TLObject.read(b) if flags & (1 << 3) else None
+        
+        return InputPeerNotifySettings(show_previews=show_previews, silent=silent, mute_until=mute_until, sound=sound)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.show_previews is not None else 0
+        flags |= (1 << 1) if self.silent is not None else 0
+        flags |= (1 << 2) if self.mute_until is not None else 0
+        flags |= (1 << 3) if self.sound is not None else 0
+        b.write(Int(flags))
+        
+        if self.show_previews is not None:
+            b.write(Bool(self.show_previews))
+        
+        if self.silent is not None:
+            b.write(Bool(self.silent))
+        
+        if self.mute_until is not None:
+            b.write(Int(self.mute_until))
+        
+        if self.sound is not None:
+            b.write(self.sound.write())
+        
+        return b.getvalue()
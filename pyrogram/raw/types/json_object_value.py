@@ -0,0 +1,74 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class JsonObjectValue(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.JSONObjectValue`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``C0DE1BD9``
+
+    Parameters:
+        key: ``str``
+        value: :obj:`JSONValue <pyrogram.raw.base.JSONValue>`
+    """
+
+    __slots__: List[str] = ["key", "value"]
+
+    ID = 0xc0de1bd9
+    QUALNAME = "types.JsonObjectValue"
+
+    def __init__(self, *, key: str, value: "raw.base.JSONValue") -> None:
+        self.key = key  # string
+        self.value = value  # JSONValue
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "JsonObjectValue":
+        # No flags
+        
+        key = String.read(b)
+        
+        value = TLObject.read(b)
+        
+        return JsonObjectValue(key=key, value=value)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.key))
+        
+        b.write(self.value.write())
+        
+        return b.getvalue()
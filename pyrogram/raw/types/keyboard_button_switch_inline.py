@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class KeyboardButtonSwitchInline(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.KeyboardButton`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``568A748``
+
+    Parameters:
+        text: ``str``
+        query: ``str``
+        same_peer (optional): ``bool``
+    """
+
+    __slots__: List[str] = ["text", "query", "same_peer"]
+
+    ID = 0x568a748
+    QUALNAME = "types.KeyboardButtonSwitchInline"
+
+    def __init__(self, *, text: str, query: str, same_peer: Optional[bool] = None) -> None:
+        self.text = text  # string
+        self.query = query  # string
+        self.same_peer = same_peer  # flags.0?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "KeyboardButtonSwitchInline":
+        
+        flags = Int.read(b)
+        
+        same_peer = True if flags & (1 << 0) else False
+        text = String.read(b)
+        
+        query = String.read(b)
+        
+        return KeyboardButtonSwitchInline(text=text, query=query, same_peer=same_peer)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.same_peer else 0
+        b.write(Int(flags))
+        
+        b.write(String(self.text))
+        
+        b.write(String(self.query))
+        
+        return b.getvalue()
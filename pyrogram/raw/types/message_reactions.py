@@ -0,0 +1,86 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class MessageReactions(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.MessageReactions`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``4F2B9479``
+
+    Parameters:
+        results: List of :obj:`ReactionCount <pyrogram.raw.base.ReactionCount>`
+        min (optional): ``bool``
+        can_see_list (optional): ``bool``
+        recent_reactions (optional): List of :obj:`MessagePeerReaction <pyrogram.raw.base.MessagePeerReaction>`
+    """
+
+    __slots__: List[str] = ["results", "min", "can_see_list", "recent_reactions"]
+
+    ID = 0x4f2b9479
+    QUALNAME = "types.MessageReactions"
+
+    def __init__(self, *, results: List["raw.base.ReactionCount"], min: Optional[bool] = None, can_see_list: Optional[bool] = None, recent_reactions: Optional[List["raw.base.MessagePeerReaction"]] = None) -> None:
+        self.results = results  # Vector<ReactionCount>
+        self.min = min  # flags.0?true
+        self.can_see_list = can_see_list  # flags.2?true
+        self.recent_reactions = recent_reactions  # flags.1?Vector<MessagePeerReaction>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "MessageReactions":
+        
+        flags = Int.read(b)
+        
+        min = True if flags & (1 << 0) else False
+        can_see_list = True if flags & (1 << 2) else False
+        results = TLObject.read(b)
+        
+        recent_reactions = TLObject.read(b) if flags & (1 << 1) else []
+        
+        return MessageReactions(results=results, min=min, can_see_list=can_see_list, recent_reactions=recent_reactions)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.min else 0
+        flags |= (1 << 2) if self.can_see_list else 0
+        flags |= (1 << 1) if self.recent_reactions else 0
+        b.write(Int(flags))
+        
+        b.write(Vector(self.results))
+        
+        if self.recent_reactions:
+            b.write(Vector(self.recent_reactions))
+        
+        return b.getvalue()
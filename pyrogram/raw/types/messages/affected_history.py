@@ -0,0 +1,92 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class AffectedHistory(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.messages.AffectedHistory`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``B45C69D1``
+
+    Parameters:
+        pts: ``int`` ``32-bit``
+        pts_count: ``int`` ``32-bit``
+        offset: ``int`` ``32-bit``
+
+    See Also:
+        This object can be returned by 5 methods:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`messages.DeleteHistory <pyrogram.raw.functions.messages.DeleteHistory>`
+            - :obj:`messages.ReadMentions <pyrogram.raw.functions.messages.ReadMentions>`
+            - :obj:`messages.UnpinAllMessages <pyrogram.raw.functions.messages.UnpinAllMessages>`
+            - :obj:`messages.ReadReactions <pyrogram.raw.functions.messages.ReadReactions>`
+            - :obj:`channels.DeleteParticipantHistory <pyrogram.raw.functions.channels.DeleteParticipantHistory>`
+    """
+
+    __slots__: List[str] = ["pts", "pts_count", "offset"]
+
+    ID = 0xb45c69d1
+    QUALNAME = "types.messages.AffectedHistory"
+
+    def __init__(self, *, pts: int, pts_count: int, offset: int) -> None:
+        self.pts = pts  # int
+        self.pts_count = pts_count  # int
+        self.offset = offset  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "AffectedHistory":
+        # No flags
+        
+        pts = Int.read(b)
+        
+        pts_count = Int.read(b)
+        
+        offset = Int.read(b)
+        
+        return AffectedHistory(pts=pts, pts_count=pts_count, offset=offset)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.pts))
+        
+        b.write(Int(self.pts_count))
+        
+        b.write(Int(self.offset))
+        
+        return b.getvalue()
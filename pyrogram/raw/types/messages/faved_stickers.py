@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class FavedStickers(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.messages.FavedStickers`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``2CB51097``
+
+    Parameters:
+        hash: ``int`` ``64-bit``
+        packs: List of :obj:`StickerPack <pyrogram.raw.base.StickerPack>`
+        stickers: List of :obj:`Document <pyrogram.raw.base.Document>`
+
+    See Also:
+        This object can be returned by 1 method:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`messages.GetFavedStickers <pyrogram.raw.functions.messages.GetFavedStickers>`
+    """
+
+    __slots__: List[str] = ["hash", "packs", "stickers"]
+
+    ID = 0x2cb51097
+    QUALNAME = "types.messages.FavedStickers"
+
+    def __init__(self, *, hash: int, packs: List["raw.base.StickerPack"], stickers: List["raw.base.Document"]) -> None:
+        self.hash = hash  # long
+        self.packs = packs  # Vector<StickerPack>
+        self.stickers = stickers  # Vector<Document>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "FavedStickers":
+        # No flags
+        
+        hash = Long.read(b)
+        
+        packs = TLObject.read(b)
+        
+        stickers = TLObject.read(b)
+        
+        return FavedStickers(hash=hash, packs=packs, stickers=stickers)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.hash))
+        
+        b.write(Vector(self.packs))
+        
+        b.write(Vector(self.stickers))
+        
+        return b.getvalue()
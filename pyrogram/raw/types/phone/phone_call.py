@@ -0,0 +1,84 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class PhoneCall(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.phone.PhoneCall`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``EC82E140``
+
+    Parameters:
+        phone_call: :obj:`PhoneCall <pyrogram.raw.base.PhoneCall>`
+        users: List of :obj:`User <pyrogram.raw.base.User>`
+
+    See Also:
+        This object can be returned by 3 methods:
+
+        .. hlist::
+            :columns: 2
+
+            - :obj:`phone.RequestCall <pyrogram.raw.functions.phone.RequestCall>`
+            - :obj:`phone.AcceptCall <pyrogram.raw.functions.phone.AcceptCall>`
+            - :obj:`phone.ConfirmCall <pyrogram.raw.functions.phone.ConfirmCall>`
+    """
+
+    __slots__: List[str] = ["phone_call", "users"]
+
+    ID = 0xec82e140
+    QUALNAME = "types.phone.PhoneCall"
+
+    def __init__(self, *, phone_call: "raw.base.PhoneCall", users: List["raw.base.User"]) -> None:
+        self.phone_call = phone_call  # PhoneCall
+        self.users = users  # Vector<User>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "PhoneCall":
+        # No flags
+        
+        phone_call = TLObject.read(b)
+        
+        users = TLObject.read(b)
+        
+        return PhoneCall(phone_call=phone_call, users=users)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.phone_call.write())
+        
+        b.write(Vector(self.users))
+        
+        return b.getvalue()
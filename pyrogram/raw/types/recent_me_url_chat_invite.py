@@ -0,0 +1,74 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class RecentMeUrlChatInvite(TLObject):  # type: ignore
+    """This object is a constructor of the base type :obj:`~pyrogram.raw.base.RecentMeUrl`.
+
+    Details:
+        - Layer: ``142``
+        - ID: ``EB49081D``
+
+    Parameters:
+        url: ``str``
+        chat_invite: :obj:`ChatInvite <pyrogram.raw.base.ChatInvite>`
+    """
+
+    __slots__: List[str] = ["url", "chat_invite"]
+
+    ID = 0xeb49081d
+    QUALNAME = "types.RecentMeUrlChatInvite"
+
+    def __init__(self, *, url: str, chat_invite: "raw.base.ChatInvite") -> None:
+        self.url = url  # string
+        self.chat_invite = chat_invite  # ChatInvite
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "RecentMeUrlChatInvite":
+        # No flags
+        
+        url = String.read(b)
+        
+        chat_invite = TLObject.read(b)
+        
+        return RecentMeUrlChatInvite(url=url, chat_invite=chat_invite)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.url))
+        
+        b.write(self.chat_invite.write())
+        
+        return b.getvalue()
@@ -84,5 +84,8 @@ setup(
     },
     packages=find_packages(exclude=["compiler*", "tests*"]),
     zip_safe=False,
-    install_requires=requires
+    install_requires=requires,
+    extras_require={
+        "fast": ["tgcrypto", "uvloop; sys_platform != 'win32'"]
+    }
 )
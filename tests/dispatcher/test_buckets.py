@@ -0,0 +1,124 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.dispatcher import Dispatcher
+from pyrogram.handlers import MessageHandler, EditedMessageHandler, RawUpdateHandler, UserStatusHandler
+from tests.dispatcher import Client, settle
+
+
+async def callback(*args):
+    pass
+
+
+class CustomMessageHandler(MessageHandler):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_raw_handlers_interleaved():
+    d = Dispatcher(Client())
+
+    r1 = RawUpdateHandler(callback)
+    m1 = MessageHandler(callback)
+    r2 = RawUpdateHandler(callback)
+    e1 = EditedMessageHandler(callback)
+
+    for handler in (r1, m1, r2, e1):
+        d.add_handler(handler, 0)
+
+    await settle()
+
+    group = d.groups_snapshot[0]
+
+    assert group[RawUpdateHandler] == (r1, r2)
+    assert group[MessageHandler] == (r1, m1, r2)
+    assert group[EditedMessageHandler] == (r1, r2, e1)
+
+
+@pytest.mark.asyncio
+async def test_subclass_bucket():
+    d = Dispatcher(Client())
+
+    h = CustomMessageHandler(callback)
+    d.add_handler(h, 0)
+
+    await settle()
+
+    assert d.groups_snapshot[0][MessageHandler] == (h,)
+    assert d.groups_snapshot[0][CustomMessageHandler] == (h,)
+
+
+@pytest.mark.asyncio
+async def test_groups_sorted():
+    d = Dispatcher(Client())
+
+    handlers = {group: MessageHandler(callback) for group in (5, -1, 2)}
+
+    for group, handler in handlers.items():
+        d.add_handler(handler, group)
+
+    await settle()
+
+    assert [group[MessageHandler] for group in d.groups_snapshot] == [
+        (handlers[-1],), (handlers[2],), (handlers[5],)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_per_group():
+    d = Dispatcher(Client())
+    calls = []
+
+    async def on_message(client, message):
+        calls.append(("message", message))
+
+    async def on_raw(client, update, users, chats):
+        calls.append(("raw", update))
+
+    d.add_handler(MessageHandler(on_message), 0)
+    d.add_handler(RawUpdateHandler(on_raw), 1)
+
+    await settle()
+
+    update = raw.types.UpdateUserStatus(user_id=1, status=raw.types.UserStatusEmpty())
+
+    await d.handle_update(update, {}, {}, "parsed", MessageHandler)
+    await d.handle_update(update, {}, {}, "parsed", UserStatusHandler)
+
+    assert calls == [("message", "parsed"), ("raw", update), ("raw", update)]
+
+
+@pytest.mark.asyncio
+async def test_remove_handler():
+    d = Dispatcher(Client())
+
+    r1 = RawUpdateHandler(callback)
+    m1 = MessageHandler(callback)
+
+    d.add_handler(r1, 0)
+    d.add_handler(m1, 0)
+    await settle()
+
+    d.remove_handler(r1, 0)
+    await settle()
+
+    assert d.groups_snapshot[0][MessageHandler] == (m1,)
+    assert d.groups_snapshot[0][RawUpdateHandler] == ()
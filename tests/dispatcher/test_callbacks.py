@@ -0,0 +1,163 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+import pyrogram
+from pyrogram import raw
+from pyrogram.dispatcher import Dispatcher
+from pyrogram.handlers import MessageHandler, ErrorHandler
+from tests.dispatcher import Client, settle
+
+update = raw.types.UpdateConfig()
+
+
+class AsyncCallable:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def __call__(self, client, message):
+        self.calls.append(message)
+
+
+async def register(d, callback, **kwargs):
+    handler = MessageHandler(callback, **kwargs)
+
+    d.add_handler(handler, 0)
+    await settle()
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_coroutine_function():
+    d = Dispatcher(Client())
+    calls = []
+
+    async def callback(client, message):
+        calls.append(message)
+
+    handler = await register(d, callback)
+
+    assert handler._is_coro is True
+
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    assert calls == ["message"]
+
+
+@pytest.mark.asyncio
+async def test_wrapped_coroutine_function():
+    d = Dispatcher(Client())
+    calls = []
+
+    handler = await register(d, AsyncCallable(calls))
+
+    assert handler._is_coro is None
+
+    await d.start()
+    await d.handle_update(update, {}, {}, "first", MessageHandler)
+
+    assert handler._is_coro is True
+
+    await d.handle_update(update, {}, {}, "second", MessageHandler)
+    await d.stop()
+
+    assert calls == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_sync_function():
+    d = Dispatcher(Client())
+    calls = []
+
+    def callback(client, message):
+        calls.append(message)
+
+    handler = await register(d, callback)
+
+    assert handler._is_coro is None
+
+    await d.start()
+    await d.handle_update(update, {}, {}, "first", MessageHandler)
+
+    assert handler._is_coro is False
+
+    await d.handle_update(update, {}, {}, "second", MessageHandler)
+    await d.stop()
+
+    assert calls == ["first", "second"]
+
+
+
+@pytest.mark.asyncio
+async def test_wrapped_coroutine_error_handler():
+    d = Dispatcher(Client())
+    calls = []
+
+    class AsyncErrorCallable:
+        async def __call__(self, client, error, message):
+            calls.append(message)
+
+    async def callback(client, message):
+        raise ValueError
+
+    error_handler = ErrorHandler(AsyncErrorCallable(), ValueError)
+
+    d.add_handler(error_handler, 0)
+    await register(d, callback)
+
+    assert error_handler._is_coro is None
+
+    await d.start()
+    await d.handle_update(update, {}, {}, "first", MessageHandler)
+
+    assert error_handler._is_coro is True
+
+    await d.handle_update(update, {}, {}, "second", MessageHandler)
+    await d.stop()
+
+    assert calls == ["first", "second"]
+
+@pytest.mark.asyncio
+async def test_run_sync_inline():
+    d = Dispatcher(Client())
+    calls = []
+
+    def callback(client, message):
+        calls.append(message)
+
+    await register(d, callback, run_sync_inline=True)
+
+    # No running loop is captured and no executor is needed for inline callbacks
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    assert calls == ["message"]
+
+
+def test_run_sync_inline_decorator():
+    @pyrogram.Client.on_message(run_sync_inline=True)
+    def callback(client, message):
+        pass
+
+    @pyrogram.Client.on_raw_update()
+    def raw_callback(client, update, users, chats):
+        pass
+
+    assert callback.handlers[0][0].run_sync_inline is True
+    assert raw_callback.handlers[0][0].run_sync_inline is False
@@ -0,0 +1,91 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from pyrogram import raw, utils
+from pyrogram.dispatcher import Dispatcher
+
+
+def test_message_peer_user():
+    update = raw.types.UpdateNewMessage(
+        message=raw.types.MessageEmpty(id=1, peer_id=raw.types.PeerUser(user_id=123)),
+        pts=1,
+        pts_count=1
+    )
+
+    assert Dispatcher.get_update_chat_id(update) == 123
+
+
+def test_message_peer_chat():
+    update = raw.types.UpdateNewMessage(
+        message=raw.types.MessageEmpty(id=1, peer_id=raw.types.PeerChat(chat_id=123)),
+        pts=1,
+        pts_count=1
+    )
+
+    assert Dispatcher.get_update_chat_id(update) == -123
+
+
+def test_message_peer_channel():
+    update = raw.types.UpdateNewChannelMessage(
+        message=raw.types.MessageEmpty(id=1, peer_id=raw.types.PeerChannel(channel_id=123)),
+        pts=1,
+        pts_count=1
+    )
+
+    assert Dispatcher.get_update_chat_id(update) == utils.get_channel_id(123)
+
+
+def test_peer():
+    update = raw.types.UpdateBotCallbackQuery(
+        query_id=1,
+        user_id=456,
+        peer=raw.types.PeerChat(chat_id=123),
+        msg_id=1,
+        chat_instance=1
+    )
+
+    assert Dispatcher.get_update_chat_id(update) == -123
+
+
+def test_channel_id():
+    update = raw.types.UpdateChannelParticipant(channel_id=123, date=0, actor_id=456, user_id=456, qts=1)
+
+    assert Dispatcher.get_update_chat_id(update) == utils.get_channel_id(123)
+
+
+def test_chat_id():
+    update = raw.types.UpdateChatParticipant(chat_id=123, date=0, actor_id=456, user_id=456, qts=1)
+
+    assert Dispatcher.get_update_chat_id(update) == -123
+
+
+def test_user_id():
+    update = raw.types.UpdateUserStatus(user_id=123, status=raw.types.UserStatusEmpty())
+
+    assert Dispatcher.get_update_chat_id(update) == 123
+
+
+def test_message_without_peer():
+    # Falls through to the next fields when the message has no peer
+    update = raw.types.UpdateNewMessage(message=raw.types.MessageEmpty(id=1), pts=1, pts_count=1)
+
+    assert Dispatcher.get_update_chat_id(update) == 0
+
+
+def test_fallback():
+    assert Dispatcher.get_update_chat_id(raw.types.UpdateConfig()) == 0
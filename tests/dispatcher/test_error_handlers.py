@@ -0,0 +1,115 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.dispatcher import Dispatcher
+from pyrogram.handlers import MessageHandler, ErrorHandler
+from tests.dispatcher import Client, settle
+
+update = raw.types.UpdateConfig()
+
+
+def error_handler(calls, name, errors=None):
+    async def callback(client, error, message):
+        calls.append((name, type(error)))
+
+    return ErrorHandler(callback, errors)
+
+
+def raising(error):
+    async def callback(client, message):
+        raise error
+
+    return MessageHandler(callback)
+
+
+@pytest.mark.asyncio
+async def test_most_specific():
+    d = Dispatcher(Client())
+    calls = []
+
+    d.add_handler(error_handler(calls, "global"), 0)
+    d.add_handler(error_handler(calls, "exception", Exception), 0)
+    d.add_handler(error_handler(calls, "value", ValueError), 0)
+    d.add_handler(raising(UnicodeError()), 1)
+
+    await settle()
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    # UnicodeError is a ValueError, only the handler for the closest class in its MRO runs
+    assert calls == [("value", UnicodeError)]
+
+
+@pytest.mark.asyncio
+async def test_first_registered_wins():
+    d = Dispatcher(Client())
+    calls = []
+
+    d.add_handler(error_handler(calls, "first", (KeyError, IndexError)), 0)
+    d.add_handler(error_handler(calls, "second", [KeyError]), 0)
+    d.add_handler(raising(KeyError()), 1)
+
+    await settle()
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    assert calls == [("first", KeyError)]
+
+
+@pytest.mark.asyncio
+async def test_global_fallback():
+    d = Dispatcher(Client())
+    calls = []
+
+    d.add_handler(error_handler(calls, "global"), 0)
+    d.add_handler(error_handler(calls, "value", ValueError), 0)
+    d.add_handler(raising(KeyError()), 1)
+
+    await settle()
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    assert calls == [("global", KeyError)]
+
+
+@pytest.mark.asyncio
+async def test_remove_error_handler():
+    d = Dispatcher(Client())
+    calls = []
+
+    value = error_handler(calls, "value", ValueError)
+
+    d.add_handler(error_handler(calls, "global"), 0)
+    d.add_handler(error_handler(calls, "exception", Exception), 0)
+    d.add_handler(value, 0)
+    d.add_handler(raising(ValueError()), 1)
+    await settle()
+
+    d.remove_error_handler(handler=value)
+    await settle()
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    d.remove_error_handler(error=Exception)
+    await settle()
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    d.remove_error_handler()
+    await settle()
+    await d.handle_update(update, {}, {}, "message", MessageHandler)
+
+    assert calls == [("exception", ValueError), ("global", ValueError)]
@@ -0,0 +1,174 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.dispatcher import Dispatcher
+from pyrogram.handlers import RawUpdateHandler
+from tests.dispatcher import Client, settle
+
+
+def user_status(user_id: int):
+    return raw.types.UpdateUserStatus(user_id=user_id, status=raw.types.UserStatusEmpty())
+
+
+async def dispatcher_with_raw_handler(calls, client):
+    d = Dispatcher(client)
+
+    async def on_raw(client, update, users, chats):
+        calls.append(update.user_id)
+
+    d.add_handler(RawUpdateHandler(on_raw), 0)
+    await settle()
+
+    return d
+
+
+@pytest.mark.asyncio
+async def test_batch_in_order():
+    calls = []
+    d = await dispatcher_with_raw_handler(calls, Client(shard_updates=True))
+    queue = d.updates_queues[0]
+    batches = []
+
+    async def parse_update(update, users, chats):
+        batches.append(queue.qsize())
+        return None, type(None)
+
+    d.parse_update = parse_update
+
+    for user_id in range(5):
+        queue.put_nowait((user_status(user_id), {}, {}))
+
+    queue.put_nowait(None)
+
+    await asyncio.wait_for(d.handler_worker(queue), 1)
+
+    assert calls == [0, 1, 2, 3, 4]
+    # All the updates and the stop sentinel were taken from the queue before parsing the first one
+    assert batches == [0] * 5
+
+
+@pytest.mark.asyncio
+async def test_batch_size():
+    calls = []
+    d = await dispatcher_with_raw_handler(calls, Client(shard_updates=True))
+    d.BATCH_SIZE = 2
+    queue = d.updates_queues[0]
+    batches = []
+
+    async def parse_update(update, users, chats):
+        batches.append(queue.qsize())
+        return None, type(None)
+
+    d.parse_update = parse_update
+
+    for user_id in range(3):
+        queue.put_nowait((user_status(user_id), {}, {}))
+
+    queue.put_nowait(None)
+
+    await asyncio.wait_for(d.handler_worker(queue), 1)
+
+    assert calls == [0, 1, 2]
+    assert batches == [2, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_stop_sentinel():
+    calls = []
+    d = await dispatcher_with_raw_handler(calls, Client(shard_updates=True))
+    queue = d.updates_queues[0]
+
+    queue.put_nowait((user_status(1), {}, {}))
+    queue.put_nowait(None)
+    queue.put_nowait((user_status(2), {}, {}))
+    queue.put_nowait(None)
+
+    # The worker stops at the first sentinel and leaves everything after it for another worker
+    await asyncio.wait_for(d.handler_worker(queue), 1)
+
+    assert calls == [1]
+    assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_queue_one_at_a_time():
+    calls = []
+    d = await dispatcher_with_raw_handler(calls, Client(workers=2))
+    queue = d.updates_queues[0]
+    batches = []
+
+    async def parse_update(update, users, chats):
+        batches.append(queue.qsize())
+        return None, type(None)
+
+    d.parse_update = parse_update
+
+    for user_id in range(3):
+        queue.put_nowait((user_status(user_id), {}, {}))
+
+    queue.put_nowait(None)
+
+    await asyncio.wait_for(d.handler_worker(queue), 1)
+
+    assert calls == [0, 1, 2]
+    assert batches == [3, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_parse_error_isolated():
+    calls = []
+    d = await dispatcher_with_raw_handler(calls, Client(shard_updates=True))
+    queue = d.updates_queues[0]
+
+    async def parse_update(update, users, chats):
+        if update.user_id == 1:
+            raise ValueError
+
+        return None, type(None)
+
+    d.parse_update = parse_update
+
+    for user_id in range(3):
+        queue.put_nowait((user_status(user_id), {}, {}))
+
+    queue.put_nowait(None)
+
+    await asyncio.wait_for(d.handler_worker(queue), 1)
+
+    assert calls == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_start_stop():
+    calls = []
+    d = await dispatcher_with_raw_handler(calls, Client(workers=3, shard_updates=True))
+
+    await d.start()
+
+    for user_id in range(6):
+        d.put_update(user_status(user_id), {}, {})
+
+    await asyncio.wait_for(d.stop(), 1)
+
+    assert sorted(calls) == list(range(6))
+    assert not d.handler_worker_tasks
@@ -0,0 +1,53 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.dispatcher import Dispatcher
+from tests.dispatcher import Client
+
+
+def user_status(user_id: int):
+    return raw.types.UpdateUserStatus(user_id=user_id, status=raw.types.UserStatusEmpty())
+
+
+@pytest.mark.asyncio
+async def test_shared_queue():
+    d = Dispatcher(Client(workers=4))
+
+    for user_id in range(8):
+        d.put_update(user_status(user_id), {}, {})
+
+    assert len(d.updates_queues) == 1
+    assert d.updates_queues[0].qsize() == 8
+
+
+@pytest.mark.asyncio
+async def test_sharded_queues():
+    d = Dispatcher(Client(workers=4, shard_updates=True))
+
+    for user_id in (1, 5, 2, 1):
+        d.put_update(user_status(user_id), {}, {})
+
+    assert len(d.updates_queues) == 4
+    assert [q.qsize() for q in d.updates_queues] == [0, 3, 1, 0]
+
+    updates = [d.updates_queues[1].get_nowait()[0].user_id for _ in range(3)]
+
+    assert updates == [1, 5, 1]
@@ -0,0 +1,131 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.dispatcher import Dispatcher
+from pyrogram.handlers import MessageHandler, RawUpdateHandler, UserStatusHandler
+from tests.dispatcher import Client, settle
+
+
+async def callback(*args):
+    pass
+
+
+def dispatcher(parsed):
+    d = Dispatcher(Client(shard_updates=True))
+
+    async def user_status_parser(client, update, users, chats):
+        parsed.append(update.user_id)
+        return update.user_id
+
+    d.UPDATE_PARSERS = {
+        **Dispatcher.UPDATE_PARSERS,
+        raw.types.UpdateUserStatus: (user_status_parser, UserStatusHandler)
+    }
+
+    return d
+
+
+async def run(d):
+    queue = d.updates_queues[0]
+
+    queue.put_nowait((raw.types.UpdateUserStatus(user_id=1, status=raw.types.UserStatusEmpty()), {}, {}))
+    queue.put_nowait((raw.types.UpdateConfig(), {}, {}))
+    queue.put_nowait(None)
+
+    await asyncio.wait_for(d.handler_worker(queue), 1)
+
+
+@pytest.mark.asyncio
+async def test_no_handlers():
+    parsed = []
+    d = dispatcher(parsed)
+
+    await run(d)
+
+    assert parsed == []
+
+
+@pytest.mark.asyncio
+async def test_other_handlers_only():
+    parsed = []
+    d = dispatcher(parsed)
+
+    d.add_handler(MessageHandler(callback), 0)
+    await settle()
+
+    await run(d)
+
+    assert parsed == []
+
+
+@pytest.mark.asyncio
+async def test_matching_handler():
+    parsed = []
+    received = []
+    d = dispatcher(parsed)
+
+    async def on_user_status(client, user_id):
+        received.append(user_id)
+
+    d.add_handler(UserStatusHandler(on_user_status), 0)
+    await settle()
+
+    await run(d)
+
+    assert parsed == [1]
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_raw_handler():
+    parsed = []
+    received = []
+    d = dispatcher(parsed)
+
+    async def on_raw(client, update, users, chats):
+        received.append(type(update))
+
+    d.add_handler(RawUpdateHandler(on_raw), 0)
+    await settle()
+
+    await run(d)
+
+    # Raw update handlers receive every update, so nothing is skipped
+    assert parsed == [1]
+    assert received == [raw.types.UpdateUserStatus, raw.types.UpdateConfig]
+
+
+@pytest.mark.asyncio
+async def test_removed_handler():
+    parsed = []
+    d = dispatcher(parsed)
+    handler = UserStatusHandler(callback)
+
+    d.add_handler(handler, 0)
+    await settle()
+    d.remove_handler(handler, 0)
+    await settle()
+
+    await run(d)
+
+    assert parsed == []